@@ -0,0 +1,87 @@
+"""
+Audio Preparation Stage for Relativity Videos
+Turns narration clips into real PCM WAV files before they reach add_sound.
+The decoded files are cached by a hash of the source bytes. Manim/pydub then
+reads them straight from the WAV header, and repeated renders never decode MP3
+"""
+
+import hashlib
+import os
+import wave
+from pathlib import Path
+
+from file_lock import copy_if_changed
+
+DEFAULT_PCM_DIR = Path("audio") / ".pcm"
+
+
+def sniff_format(path):
+    """Identify audio by its magic bytes rather than its file extension"""
+    with open(path, "rb") as f:
+        header = f.read(12)
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:3] == b"ID3" or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return "mp3"
+    if header[:4] == b"OggS":
+        return "ogg"
+    if header[:4] == b"fLaC":
+        return "flac"
+    return None
+
+
+def is_pcm_wav(path):
+    """True for WAV files Python's wave module (and pydub's fast path) can read"""
+    if sniff_format(path) != "wav":
+        return False
+    try:
+        with wave.open(str(path), "rb"):
+            return True
+    except (wave.Error, EOFError):
+        return False  # e.g. float or compressed WAV
+
+
+def source_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def decode_to_wav(source, destination):
+    """Decode any ffmpeg-readable clip to 16-bit PCM WAV"""
+    from pydub import AudioSegment
+
+    segment = AudioSegment.from_file(str(source), format=sniff_format(source))
+    tmp_path = Path(destination).with_suffix(".partial.wav")
+    segment.set_sample_width(2).export(str(tmp_path), format="wav")
+    os.replace(tmp_path, destination)
+
+
+def prepare_audio(source, output_path=None, cache_dir=DEFAULT_PCM_DIR):
+    """
+    Return the path of a real PCM WAV holding the same audio as source.
+
+    Sources that already are PCM WAV are passed through untouched. Anything
+    else is decoded once into cache_dir/<sha256 of source>.wav. If
+    output_path is given, the WAV is also copied there (e.g. audio/title.wav).
+    """
+    source = Path(source)
+    if is_pcm_wav(source):
+        prepared = source
+    else:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        prepared = cache_dir / f"{source_hash(source)}.wav"
+        if not prepared.exists():
+            print(f"🔧 Decoding {source.name} ({sniff_format(source) or 'unknown'}) to PCM WAV")
+            decode_to_wav(source, prepared)
+
+    if output_path is None:
+        return prepared
+    output_path = Path(output_path)
+    if prepared.resolve() != output_path.resolve():
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        copy_if_changed(prepared, output_path)
+    return output_path
@@ -0,0 +1,74 @@
+"""
+Inter-Process File Lock for Relativity Videos
+Serializes read-modify-write updates of shared JSON indexes (narration cache,
+duration manifest) between the worker processes of render_sections.py. The
+lock is an OS advisory lock on a sidecar file, so it is released even if a
+worker crashes. Also holds the atomic JSON write and the copy-if-changed
+helper those caches share
+
+Usage:
+    with file_lock(index_path.with_suffix(".lock")):
+        index = read_index()
+        index.update(mine)
+        write_index(index)
+"""
+
+import filecmp
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def file_lock(lock_path):
+    """Hold an exclusive lock on lock_path for the duration of the block"""
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # Retries for ~10 s itself
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def write_json_atomic(path, data):
+    """Write JSON through a per-process temp file so concurrent writers never share one"""
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def copy_if_changed(source, destination):
+    """
+    Copy source to destination unless it already holds the same bytes.
+    Leaving an unchanged file alone keeps its mtime, so mtime-keyed caches
+    (narration_timing.DurationManifest) don't re-probe it on every render
+    """
+    source, destination = Path(source), Path(destination)
+    if destination.exists() and filecmp.cmp(source, destination, shallow=False):
+        return destination
+    shutil.copyfile(source, destination)
+    return destination
@@ -4,9 +4,14 @@ This script generates audio files for your relativity explanations
 """
 
 import asyncio
-import edge_tts
+import json
 from pathlib import Path
 import os
+from narration_cache import NarrationCache
+from narration_pool import NarrationPool
+from narration_timing import DurationManifest
+from relativity_physics import gamma, length_contraction, rest_energy
+from tts_backends import get_backend
 
 class RelativityNarrator:
     def __init__(self):
@@ -21,23 +26,35 @@ class RelativityNarrator:
         self.voice = "en-US-AriaNeural"
         self.rate = "+0%"  # Speed: -50% to +100%
         self.volume = "+0%"  # Volume: -50% to +50%
+        self.narration_cache = NarrationCache(self.audio_dir / ".cache")
+        self.concurrency = 4  # Clips synthesized at once (1 = one after another)
+        self.backend = get_backend()  # Set RELATIVITY_TTS_BACKEND=pyttsx3 or fake offline
+        self.word_timings = {}  # Word boundaries captured while synthesizing
 
     async def generate_audio(self, text, filename):
         """Generate audio file from text"""
-        output_path = self.audio_dir / f"{filename}.mp3"
+        output_path = self.audio_dir / f"{filename}{self.backend.suffix}"
         
-        print(f"🎙️ Generating: {filename}.mp3")
+        print(f"🎙️ Generating: {output_path.name}")
         print(f"📝 Text: {text[:60]}...")
         
-        communicate = edge_tts.Communicate(text, self.voice, rate=self.rate, volume=self.volume)
-        await communicate.save(str(output_path))
+        # Word timings come from the same TTS request that writes the audio
+        _, hit, words = await self.narration_cache.fetch_timed(self.backend, text, output_path,
+                                                               self.voice, rate=self.rate,
+                                                               volume=self.volume)
+        self.word_timings[filename] = {"text": text, "words": words}
         
-        print(f"✅ Saved: {output_path}")
+        print(f"{'📁 Cached' if hit else '✅ Saved'}: {output_path}")
         return output_path
 
     async def generate_all_narrations(self):
         """Generate all audio files for the relativity video"""
         
+        # Numbers spoken in the narration come from the physics module
+        gamma_08 = gamma(0.8)
+        ruler_08 = length_contraction(8, 0.8)
+        gram_energy = rest_energy(1e-3) / 1e12  # trillion joules
+        
         narrations = {
             "title_intro": """
                 Welcome to Einstein's Theory of Relativity explained. 
@@ -61,25 +78,25 @@ class RelativityNarrator:
                 runs significantly slower.
             """,
             
-            "time_dilation_formula": """
+            "time_dilation_formula": f"""
                 The mathematical relationship is given by the time dilation formula, 
                 where gamma is the Lorentz factor. For an object moving at 80% the speed of light, 
-                gamma equals 1.67, meaning time runs 67% slower for the moving observer.
+                gamma equals {gamma_08:.2f}, meaning time runs {(gamma_08 - 1) * 100:.0f}% slower for the moving observer.
             """,
             
-            "length_contraction": """
+            "length_contraction": f"""
                 Another fascinating effect is length contraction. Objects moving at high speeds 
                 appear shorter in the direction of motion when observed from a stationary frame. 
                 Here we see a ruler that is 8 units long when at rest, but when moving at 
-                80% the speed of light, it appears to contract to only 4.8 units in length.
+                80% the speed of light, it appears to contract to only {ruler_08:.1f} units in length.
             """,
             
-            "energy_mass": """
+            "energy_mass": f"""
                 Perhaps Einstein's most famous equation is E equals M C squared. 
                 This revolutionary formula reveals that mass and energy are equivalent - 
                 even a tiny amount of mass contains an enormous amount of energy. 
                 Just one gram of matter, if completely converted to energy, would release 
-                90 trillion joules - enough energy to power a large city for several hours.
+                {gram_energy:.0f} trillion joules - enough energy to power a large city for several hours.
             """,
             
             "spacetime_curvature": """
@@ -106,17 +123,50 @@ class RelativityNarrator:
         print("🎬 Generating all narration audio files...")
         print("="*60)
         
-        for filename, text in narrations.items():
-            # Clean up the text (remove extra whitespace)
-            clean_text = " ".join(text.split())
-            await self.generate_audio(clean_text, filename)
-            print()  # Empty line for readability
+        # Clean up the text (remove extra whitespace) and queue every clip
+        jobs = {
+            filename: (lambda text=" ".join(text.split()), filename=filename:
+                       self.generate_audio(text, filename))
+            for filename, text in narrations.items()
+        }
+        
+        pool = NarrationPool(concurrency=self.concurrency)
+        results = await pool.run(jobs)
+        print()
+        pool.summary()
+        self.narration_cache.report()
         
-        print("🎉 All audio files generated successfully!")
+        failed = [name for name, result in results.items() if isinstance(result, BaseException)]
+        if failed:
+            print(f"⚠️ {len(failed)} narration(s) failed: {', '.join(failed)}")
+        else:
+            print("🎉 All audio files generated successfully!")
         print(f"📁 Check the '{self.audio_dir}' folder for your audio files.")
         
+        self.save_word_timings([name for name in narrations if name not in failed])
         return list(narrations.keys())
 
+    def save_word_timings(self, order, path=None):
+        """Write clip durations and word boundaries for generate_subtitles.py"""
+        path = Path(path or self.audio_dir / "word_timings.json")
+        durations = DurationManifest(self.audio_dir / "durations.json")
+        
+        clips = []
+        for name in order:
+            audio_path = self.audio_dir / f"{name}{self.backend.suffix}"
+            clips.append({
+                "name": name,
+                "audio": str(audio_path),
+                "duration": durations.duration(audio_path),
+                **self.word_timings.get(name, {}),
+            })
+        
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"backend": self.backend.name, "clips": clips}, f, indent=2)
+        
+        print(f"⏱️ Saved word timings: {path}")
+        return path
+
     def create_audio_sync_script(self):
         """Create a script showing when to play each audio file"""
         script = """
@@ -165,9 +215,11 @@ async def main():
     
     print("🎙️ Einstein's Relativity Narrator")
     print("=" * 40)
+    print(f"Backend: {narrator.backend.name}")
     print(f"Voice: {narrator.voice}")
     print(f"Speed: {narrator.rate}")
     print(f"Volume: {narrator.volume}")
+    print(f"Concurrency: {narrator.concurrency}")
     print()
     
     # Generate all audio files
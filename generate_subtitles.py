@@ -3,11 +3,57 @@ Subtitle Generator for Einstein's Relativity Video
 Creates SRT subtitle files that can be used with any video player
 """
 
-import asyncio
-import edge_tts
+import argparse
+import json
 from pathlib import Path
 import re
 
+
+def build_timed_cues(clips, max_words=8, max_gap=0.35, clip_gap=0.0, clip_starts=None):
+    """
+    Group word boundaries into (start, end, text) cues.
+
+    A cue breaks after max_words words, at sentence-final punctuation, or
+    at a pause longer than max_gap seconds. Clips are laid back-to-back (plus clip_gap) unless
+    clip_starts maps clip names to their start time in the video.
+    """
+    cues = []
+    cursor = 0.0
+    for clip in clips:
+        start = clip_starts.get(clip["name"], cursor) if clip_starts else cursor
+        words = clip.get("words")
+        if not words:
+            # Backend gave no boundaries: spread the text evenly over the clip
+            tokens = clip.get("text", "").split()
+            step = clip["duration"] / max(len(tokens), 1)
+            words = [[i * step, step, token] for i, token in enumerate(tokens)]
+
+        group = []
+        for offset, duration, word in words:
+            if group:
+                last_end = group[-1][0] + group[-1][1]
+                if len(group) >= max_words or offset - last_end > max_gap:
+                    cues.append(_cue_from_words(group, start))
+                    group = []
+            group.append((offset, duration, word))
+            if word.endswith((".", "!", "?")):
+                cues.append(_cue_from_words(group, start))
+                group = []
+        if group:
+            cues.append(_cue_from_words(group, start))
+
+        cursor = start + clip["duration"] + clip_gap
+    return cues
+
+
+def _cue_from_words(words, clip_start):
+    first_offset = words[0][0]
+    last_offset, last_duration, _ = words[-1]
+    return (clip_start + first_offset,
+            clip_start + last_offset + last_duration,
+            " ".join(word for _, _, word in words))
+
+
 class SubtitleGenerator:
     def __init__(self):
         self.audio_dir = Path("audio")
@@ -109,6 +155,48 @@ class SubtitleGenerator:
         print(f"✅ Created WebVTT file: {vtt_path}")
         return vtt_path
 
+    def load_word_timings(self, timings_path=None):
+        """Load the clips written by RelativityNarrator.save_word_timings"""
+        timings_path = Path(timings_path or self.audio_dir / "word_timings.json")
+        with open(timings_path, encoding="utf-8") as f:
+            return json.load(f)["clips"]
+
+    def build_timed_cues(self, clips, **cue_options):
+        """Group word boundaries into (start, end, text) cues; see build_timed_cues()"""
+        return build_timed_cues(clips, **cue_options)
+
+    @staticmethod
+    def format_timestamp(seconds, separator=","):
+        """HH:MM:SS,mmm for SRT (use separator='.' for WebVTT)"""
+        millis = int(round(seconds * 1000))
+        hours, millis = divmod(millis, 3_600_000)
+        minutes, millis = divmod(millis, 60_000)
+        secs, millis = divmod(millis, 1000)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+    def generate_timed_subtitles(self, timings_path=None, **cue_options):
+        """Write SRT and WebVTT files whose cues come from real word timings"""
+        cues = self.build_timed_cues(self.load_word_timings(timings_path), **cue_options)
+
+        srt_content = ""
+        vtt_content = "WEBVTT\n\n"
+        for i, (start, end, text) in enumerate(cues, 1):
+            srt_content += f"{i}\n"
+            srt_content += f"{self.format_timestamp(start)} --> {self.format_timestamp(end)}\n"
+            srt_content += f"{text}\n\n"
+            vtt_content += (f"{self.format_timestamp(start, '.')} --> "
+                            f"{self.format_timestamp(end, '.')}\n{text}\n\n")
+
+        srt_path = self.subtitle_dir / "relativity_subtitles.srt"
+        vtt_path = self.subtitle_dir / "relativity_subtitles.vtt"
+        with open(srt_path, 'w', encoding='utf-8') as f:
+            f.write(srt_content)
+        with open(vtt_path, 'w', encoding='utf-8') as f:
+            f.write(vtt_content)
+
+        print(f"✅ Created {len(cues)} timed cues: {srt_path}, {vtt_path}")
+        return srt_path, vtt_path
+
     def generate_subtitle_overlay_script(self):
         """Generate a script to overlay subtitles on existing video"""
         
@@ -171,6 +259,10 @@ ffmpeg -i input_video.mp4 -i subtitles/relativity_subtitles.srt -c copy -c:s mov
 
 def main():
     """Generate all subtitle files"""
+    parser = argparse.ArgumentParser(description="Generate subtitle files for the relativity video")
+    parser.add_argument("--from-audio", action="store_true",
+                        help="build cues from audio/word_timings.json (run generate_narration.py first)")
+    args = parser.parse_args()
     
     print("📝 Einstein's Relativity Subtitle Generator")
     print("="*45)
@@ -180,8 +272,11 @@ def main():
     print("\n🎯 Generating subtitle files...")
     
     # Generate different formats
-    generator.generate_srt_subtitles()
-    generator.generate_vtt_subtitles()
+    if args.from_audio:
+        generator.generate_timed_subtitles()
+    else:
+        generator.generate_srt_subtitles()
+        generator.generate_vtt_subtitles()
     generator.generate_subtitle_overlay_script()
     generator.create_multi_language_subtitles()
     
@@ -0,0 +1,189 @@
+"""
+Minkowski Spacetime Diagrams for Relativity Videos
+Worldlines, light cones and events are stored as NumPy arrays of rest-frame
+(x, ct) coordinates. Each frame the observer velocity is read from a
+ValueTracker and one 2x2 Lorentz boost is applied to every stored vertex in
+a single matrix multiply; the segments are then clipped to the diagram box
+in one vectorized pass. Hundreds of worldlines cost about as much as one
+
+Usage inside a scene:
+    diagram = MinkowskiDiagram(x_range=(-4, 4), ct_range=(0, 4)).shift(DOWN * 2)
+    diagram.add_frame_grid(spacing=0.5)               # rest observers + simultaneity lines
+    diagram.add_observer(0.6, color=RED)
+    diagram.add_light_cone((0, 0))
+    self.play(FadeIn(diagram))
+    self.play(diagram.boost_to(0.6), run_time=3)      # light cones stay at 45 degrees
+"""
+
+from manim import (DOWN, LEFT, RIGHT, UP, WHITE, YELLOW, Arrow, Group, PMobject, Point, Text,
+                   ValueTracker, VMobject, color_to_rgb)
+import numpy as np
+
+from relativity_physics import gamma
+
+REACH = 3.0  # Stored lines extend this many times past the box, so boosted views stay filled
+
+
+class MinkowskiDiagram(Group):
+    def __init__(self, x_range=(-4, 4), ct_range=(-4, 4), unit=0.8, velocity=0.0,
+                 axis_color=WHITE, show_axes=True, **kwargs):
+        """
+        x_range, ct_range: visible box in light-units
+        unit: scene units per light-unit
+        velocity: initial observer velocity (fraction of c) the diagram is drawn for
+        """
+        super().__init__(**kwargs)
+        self.x_range = x_range
+        self.ct_range = ct_range
+        self.unit = unit
+        self.velocity = ValueTracker(velocity)
+        self.anchor = Point()  # Scene position of the event x = ct = 0; moves with the group
+        self.segments = np.zeros((0, 2, 2))  # (segment, endpoint, [x, ct]) in the rest frame
+        self.events = np.zeros((0, 2))
+        self.line_layers = {}   # (color, width, opacity) -> [VMobject, segment indices]
+        self.event_layers = []  # [PMobject, event indices, rgb]
+        self.add(self.anchor)
+        if show_axes:
+            self.add(self.create_axes(axis_color))
+        self.add_updater(lambda mob: mob.update_boost())
+
+    def create_axes(self, color):
+        (x0, x1), (t0, t1) = self.x_range, self.ct_range
+        u = self.unit
+        x_axis = Arrow(np.array([x0 * u, 0, 0]), np.array([x1 * u, 0, 0]), buff=0,
+                       color=color, stroke_width=2, tip_length=0.15)
+        ct_axis = Arrow(np.array([0, t0 * u, 0]), np.array([0, t1 * u, 0]), buff=0,
+                        color=color, stroke_width=2, tip_length=0.15)
+        x_label = Text("x", font_size=18, color=color).next_to(x_axis, DOWN, buff=0.1)
+        x_label.align_to(x_axis, RIGHT)
+        ct_label = Text("ct", font_size=18, color=color).next_to(ct_axis, LEFT, buff=0.1)
+        ct_label.align_to(ct_axis, UP)
+        return Group(x_axis, ct_axis, x_label, ct_label)
+
+    # Adding geometry (rest-frame coordinates)
+
+    def _line_layer(self, color, stroke_width, opacity):
+        key = (str(color), stroke_width, opacity)
+        if key not in self.line_layers:
+            layer = VMobject(stroke_color=color, stroke_width=stroke_width,
+                             stroke_opacity=opacity)
+            self.add(layer)
+            self.line_layers[key] = [layer, np.zeros(0, dtype=int)]
+        return self.line_layers[key]
+
+    def add_segments(self, segments, color=WHITE, stroke_width=2, opacity=1.0):
+        """Append (n, 2, 2) straight segments of [x, ct] endpoints in one style"""
+        segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2)
+        entry = self._line_layer(color, stroke_width, opacity)
+        start = len(self.segments)
+        self.segments = np.concatenate([self.segments, segments])
+        entry[1] = np.concatenate([entry[1], np.arange(start, len(self.segments))])
+        self.update_boost()
+        return self
+
+    def add_worldline(self, points, **style):
+        """Polyline through [x, ct] points, e.g. an out-and-back journey"""
+        points = np.asarray(points, dtype=float)
+        return self.add_segments(np.stack([points[:-1], points[1:]], axis=1), **style)
+
+    def add_worldlines(self, lines, **style):
+        """Many polylines at once, shape (n_lines, n_points, 2)"""
+        lines = np.asarray(lines, dtype=float)
+        return self.add_segments(np.stack([lines[:, :-1], lines[:, 1:]], axis=2), **style)
+
+    def span(self):
+        """Half-length of lines long enough to cross the box from anywhere inside it"""
+        return REACH * max(np.ptp(self.x_range), np.ptp(self.ct_range))
+
+    def add_observer(self, velocity, x0=0.0, **style):
+        """Straight worldline x = x0 + velocity * ct"""
+        s = self.span()
+        return self.add_worldline([[x0 - velocity * s, -s], [x0 + velocity * s, s]], **style)
+
+    def add_light_cone(self, event, color=YELLOW, stroke_width=2, opacity=1.0):
+        """The two light rays through an event"""
+        x, ct = event
+        s = self.span()
+        return self.add_segments([[[x - s, ct - s], [x + s, ct + s]],
+                                  [[x + s, ct - s], [x - s, ct + s]]],
+                                 color=color, stroke_width=stroke_width, opacity=opacity)
+
+    def add_frame_grid(self, spacing=0.5, color=WHITE, stroke_width=1, opacity=0.25):
+        """Worldlines of rest observers and lines of rest-frame simultaneity"""
+        s = self.span()
+        ticks = np.arange(-s, s + spacing / 2, spacing)
+        ticks -= ticks[np.argmin(np.abs(ticks))]  # Keep a line through the origin
+        ones = np.ones_like(ticks)
+        verticals = np.stack([np.column_stack([ticks, -s * ones]),
+                              np.column_stack([ticks, s * ones])], axis=1)
+        horizontals = np.stack([np.column_stack([-s * ones, ticks]),
+                                np.column_stack([s * ones, ticks])], axis=1)
+        return self.add_segments(np.concatenate([verticals, horizontals]), color=color,
+                                 stroke_width=stroke_width, opacity=opacity)
+
+    def add_events(self, points, color=WHITE, size=6):
+        """Point events drawn as one point cloud"""
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        start = len(self.events)
+        self.events = np.concatenate([self.events, points])
+        layer = PMobject(stroke_width=size)
+        self.add(layer)
+        self.event_layers.append([layer, np.arange(start, len(self.events)), color_to_rgb(color)])
+        self.update_boost()
+        return self
+
+    # Per-frame update
+
+    def boost_matrix(self):
+        """Lorentz boost acting on [x, ct] row vectors"""
+        beta = self.velocity.get_value()
+        return float(gamma(beta)) * np.array([[1.0, -beta], [-beta, 1.0]])
+
+    def clip_segments(self, segments):
+        """Liang-Barsky clip of (n, 2, 2) segments to the box; hidden ones collapse to a point"""
+        p0, d = segments[:, 0], segments[:, 1] - segments[:, 0]
+        lo = np.array([self.x_range[0], self.ct_range[0]])
+        hi = np.array([self.x_range[1], self.ct_range[1]])
+        p = np.concatenate([-d, d], axis=1)                # (n, 4)
+        q = np.concatenate([p0 - lo, hi - p0], axis=1)     # (n, 4)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = q / p
+        t0 = np.max(np.where(p < 0, ratio, 0.0), axis=1)
+        t1 = np.min(np.where(p > 0, ratio, 1.0), axis=1)
+        visible = (t0 <= t1) & ~np.any((p == 0) & (q < 0), axis=1)
+        t0 = np.where(visible, np.clip(t0, 0, 1), 0.0)
+        t1 = np.where(visible, np.clip(t1, 0, 1), 0.0)
+        clipped = np.stack([p0 + t0[:, None] * d, p0 + t1[:, None] * d], axis=1)
+        return np.clip(clipped, lo, hi)
+
+    def to_scene(self, xct):
+        """[x, ct] diagram coordinates -> scene points"""
+        points = np.zeros(xct.shape[:-1] + (3,))
+        points[..., :2] = xct * self.unit
+        return points + self.anchor.get_center()
+
+    def update_boost(self):
+        boost = self.boost_matrix()
+        if len(self.segments):
+            boosted = (self.segments.reshape(-1, 2) @ boost.T).reshape(-1, 2, 2)
+            ends = self.to_scene(self.clip_segments(boosted))
+            p0, p1 = ends[:, 0], ends[:, 1]
+            bezier = np.stack([p0, (2 * p0 + p1) / 3, (p0 + 2 * p1) / 3, p1], axis=1)
+            for layer, ids in self.line_layers.values():
+                layer.points = bezier[ids].reshape(-1, 3)
+        if len(self.events):
+            boosted = self.events @ boost.T
+            lo = np.array([self.x_range[0], self.ct_range[0]])
+            hi = np.array([self.x_range[1], self.ct_range[1]])
+            inside = np.all((boosted >= lo) & (boosted <= hi), axis=1)
+            points = self.to_scene(boosted)
+            for layer, ids, rgb in self.event_layers:
+                # The point-cloud camera ignores alpha, so events outside the box are dropped
+                shown = ids[inside[ids]]
+                layer.points = points[shown]
+                layer.rgbas = np.column_stack([np.tile(rgb, (len(shown), 1)), np.ones(len(shown))])
+        return self
+
+    def boost_to(self, velocity):
+        """Animation that re-draws the diagram in the frame moving at velocity"""
+        return self.velocity.animate.set_value(velocity)
@@ -0,0 +1,187 @@
+"""
+Content-Addressed Narration Cache for Relativity Videos
+Stores synthesized narration keyed on what was actually spoken, so edited
+lines are re-synthesized and unchanged lines never touch the network
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from file_lock import copy_if_changed, file_lock, write_json_atomic
+
+DEFAULT_CACHE_DIR = Path("audio") / ".cache"
+INDEX_NAME = "index.json"
+LOCK_NAME = "index.lock"
+
+
+def normalize_text(text):
+    """Collapse whitespace so re-indented narration strings hash the same"""
+    return " ".join(text.split())
+
+
+def narration_key(text, voice, rate="+0%", volume="+0%", engine="edge-tts"):
+    """Hash of everything that changes the synthesized audio"""
+    payload = json.dumps([normalize_text(text), voice, rate, volume, engine])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class NarrationCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=None, suffix=".mp3"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / INDEX_NAME
+        self.lock_path = self.cache_dir / LOCK_NAME
+        self.max_bytes = max_bytes  # None = unbounded
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """Read the index, dropping entries whose audio has gone missing"""
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            print(f"⚠️ Narration cache index unreadable, starting fresh: {self.index_path}")
+            return {}
+        return {key: entry for key, entry in index.items()
+                if (self.cache_dir / entry["file"]).exists()}
+
+    def _save_index(self, keep=()):
+        """
+        Merge this process's entries into the index on disk and write it back.
+
+        Section workers share one cache, so the on-disk index is re-read under
+        the lock: entries other workers stored since we loaded are kept, and
+        the most recent last_used wins. Eviction runs on the merged index so
+        max_bytes bounds the whole cache, not one worker's view of it.
+        """
+        with file_lock(self.lock_path):
+            merged = self._load_index()
+            for key, entry in self.index.items():
+                other = merged.get(key)
+                if other is None or entry["last_used"] >= other["last_used"]:
+                    merged[key] = entry
+            # Drop entries whose audio another worker evicted
+            self.index = {key: entry for key, entry in merged.items()
+                          if (self.cache_dir / entry["file"]).exists()}
+            self.evict(keep=keep)
+            write_json_atomic(self.index_path, self.index)
+
+    def blob_path(self, key, suffix=None):
+        return self.cache_dir / f"{key}{suffix or self.suffix}"
+
+    def lookup(self, key):
+        """Return the cached audio path for key (and mark it used), or None"""
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        path = self.cache_dir / entry["file"]
+        if not path.exists():
+            del self.index[key]
+            return None
+        entry["last_used"] = time.time()
+        return path
+
+    def store(self, key, source_path, suffix=None, **meta):
+        """Move a freshly synthesized file into the cache"""
+        blob = self.blob_path(key, suffix)
+        os.replace(source_path, blob)
+        self.index[key] = {
+            "file": blob.name,
+            "size": blob.stat().st_size,
+            "last_used": time.time(),
+            **meta,
+        }
+        self._save_index(keep=(key,))
+        return blob
+
+    def total_bytes(self):
+        return sum(entry["size"] for entry in self.index.values())
+
+    def evict(self, keep=()):
+        """Drop least-recently-used entries until the cache fits max_bytes"""
+        if self.max_bytes is None:
+            return []
+        evicted = []
+        total = self.total_bytes()
+        by_age = sorted(self.index.items(), key=lambda item: item[1]["last_used"])
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            total -= entry["size"]
+            del self.index[key]
+            evicted.append(key)
+        if evicted:
+            print(f"🧹 Evicted {len(evicted)} narration clip(s) from cache")
+        return evicted
+
+    async def fetch(self, text, output_path, synthesize, voice,
+                    rate="+0%", volume="+0%", engine="edge-tts", suffix=None):
+        """
+        Make output_path hold the narration for text.
+
+        With output_path=None nothing is copied and the cached clip's own path
+        is returned, for callers that transcode it anyway (see audio_prep.py).
+
+        synthesize(text, path) is an async callable that writes audio to path;
+        it is only awaited on a cache miss. If it returns word timings they are
+        kept in the index next to the clip. Returns (output_path, hit).
+        """
+        clean_text = normalize_text(text)
+        key = narration_key(clean_text, voice, rate, volume, engine)
+        cached = self.lookup(key)
+        hit = cached is not None
+        if hit:
+            self.hits += 1
+            self._save_index(keep=(key,))  # Never evict the clip about to be copied out
+        else:
+            self.misses += 1
+            tmp_path = self.cache_dir / f"{key}.partial{suffix or self.suffix}"
+            words = await synthesize(clean_text, tmp_path)
+            cached = self.store(key, tmp_path, suffix, voice=voice, rate=rate, volume=volume,
+                                engine=engine, text=clean_text[:80], words=words)
+
+        if output_path is None:
+            return cached, hit
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        copy_if_changed(cached, output_path)
+        return output_path, hit
+
+    async def fetch_with(self, backend, text, output_path, voice, rate="+0%", volume="+0%"):
+        """fetch() using a tts_backends backend as the synthesizer"""
+        async def synthesize(clean_text, path):
+            return await backend.synthesize(clean_text, path, voice, rate=rate, volume=volume)
+
+        return await self.fetch(text, output_path, synthesize, voice, rate=rate,
+                                volume=volume, engine=backend.name, suffix=backend.suffix)
+
+    async def fetch_timed(self, backend, text, output_path, voice, rate="+0%", volume="+0%"):
+        """
+        fetch_with() that also returns the clip's word timings.
+
+        Timings are captured from the same request that wrote the audio, so a
+        cache hit returns them without any TTS call. Returns
+        (output_path, hit, words) where words is a list of
+        [offset_seconds, duration_seconds, word], or None if the backend
+        reports no boundaries.
+        """
+        output_path, hit = await self.fetch_with(backend, text, output_path, voice,
+                                                 rate=rate, volume=volume)
+        key = narration_key(text, voice, rate, volume, backend.name)
+        return output_path, hit, self.index[key].get("words")
+
+    def report(self):
+        """Print a one-line hit/miss summary"""
+        print(f"📦 Narration cache: {self.hits} hit(s), {self.misses} miss(es), "
+              f"{len(self.index)} clip(s), {self.total_bytes() / 1e6:.1f} MB")
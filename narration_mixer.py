@@ -0,0 +1,210 @@
+"""
+Pre-Mixed Narration Track for Relativity Videos
+Instead of overlaying every clip onto an in-memory soundtrack with add_sound,
+a scene can record a cue list (clip, start time). After the silent video is
+written, the cues are stream-mixed block by block into one WAV and muxed in
+with ffmpeg stream copy. Memory stays flat however long the video is
+
+Enable it for a render with RELATIVITY_PREMIX=1, or re-mux later:
+    python narration_mixer.py audio/cues/VoiceoverRelativityExplainer.json video.mp4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from audio_prep import DEFAULT_PCM_DIR, prepare_audio, source_hash
+
+PREMIX_ENV_VAR = "RELATIVITY_PREMIX"
+DEFAULT_CUE_DIR = Path("audio") / "cues"
+BLOCK_FRAMES = 1 << 16  # ~2.7 s at 24 kHz
+
+
+class CueRecorder:
+    """Drop-in for scene.add_sound that can record cues instead of mixing"""
+
+    def __init__(self, scene, enabled=None, cue_dir=DEFAULT_CUE_DIR):
+        self.scene = scene
+        if enabled is None:
+            enabled = os.environ.get(PREMIX_ENV_VAR, "").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+        self.cue_path = Path(cue_dir) / f"{type(scene).__name__}.json"
+        self.cues = []
+        self.output = None  # Narrated movie, once finish() has muxed one
+
+    def add_sound(self, path, gain=0.0):
+        if not self.enabled:
+            self.scene.add_sound(str(path), gain=gain)
+            return
+        self.cues.append({"path": str(path), "start": self.scene.renderer.time, "gain": gain})
+
+    def save(self):
+        self.cue_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cue_path, "w", encoding="utf-8") as f:
+            json.dump({"cues": self.cues}, f, indent=2)
+        print(f"📋 Saved {len(self.cues)} narration cue(s): {self.cue_path}")
+        return self.cue_path
+
+    def finish(self, video_path):
+        """Call after the silent movie is written: save, mix and mux"""
+        if not self.enabled or not self.cues:
+            return None
+        self.save()
+        if video_path is None:
+            return None  # No movie written (-s / --save_last_frame); the cue list is still saved
+        video_path = Path(video_path)
+        narration = video_path.with_name(f"{video_path.stem}_narration.wav")
+        output = video_path.with_name(f"{video_path.stem}_narrated{video_path.suffix}")
+        mix_cues(self.cues, narration)
+        self.output = mux_narration(video_path, narration, output)
+        return self.output
+
+    def render(self, scene_render, preview=False):
+        """
+        Run the scene's own render (pass super().render), then mux. Preview
+        is held back until the narration is in, so it opens the narrated movie
+        """
+        if not self.enabled:
+            return scene_render(preview)
+
+        from manim import config
+        from manim.utils.file_ops import open_file, open_media_file
+
+        wants_preview = preview or config.preview
+        in_browser = config.show_in_file_browser
+        config.preview = False
+        config.show_in_file_browser = False
+        try:
+            result = scene_render(False)
+        finally:
+            config.preview = wants_preview
+            config.show_in_file_browser = in_browser
+
+        output = self.finish(self.scene.renderer.file_writer.movie_file_path)
+        if output is None:
+            if wants_preview or in_browser:
+                open_media_file(self.scene.renderer.file_writer)
+        else:
+            if wants_preview:
+                open_file(output)
+            if in_browser:
+                open_file(output, in_browser=True)
+        return result
+
+
+def load_cues(cue_path):
+    with open(cue_path, encoding="utf-8") as f:
+        return json.load(f)["cues"]
+
+
+def resampled_path(wav_path, sample_rate, cache_dir=DEFAULT_PCM_DIR):
+    """
+    Where the sample_rate copy of wav_path is cached. Keyed on the source's
+    content, so a re-synthesized clip with the same name is resampled again
+    """
+    return Path(cache_dir) / f"{source_hash(wav_path)}_{sample_rate}.wav"
+
+
+def _open_sources(cues, sample_rate):
+    """Open every cue as PCM WAV, resampling once where its rate differs"""
+    sources = []
+    for cue in sorted(cues, key=lambda c: c["start"]):
+        wav_path = prepare_audio(cue["path"])
+        reader = wave.open(str(wav_path), "rb")
+        if reader.getframerate() != sample_rate or reader.getsampwidth() != 2:
+            reader.close()
+            from pydub import AudioSegment
+
+            resampled = resampled_path(wav_path, sample_rate)
+            if not resampled.exists():
+                resampled.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = resampled.with_suffix(f".{os.getpid()}.tmp.wav")
+                (AudioSegment.from_wav(str(wav_path))
+                 .set_frame_rate(sample_rate).set_sample_width(2)
+                 .export(str(tmp_path), format="wav"))
+                os.replace(tmp_path, resampled)  # Section workers may resample the same clip
+            reader = wave.open(str(resampled), "rb")
+        start = int(round(cue["start"] * sample_rate))
+        sources.append({
+            "reader": reader,
+            "start": start,
+            "end": start + reader.getnframes(),
+            "channels": reader.getnchannels(),
+            "scale": 10 ** (cue.get("gain", 0.0) / 20),
+        })
+    return sources
+
+
+def mix_cues(cues, output_path, sample_rate=24000, channels=1, block_frames=BLOCK_FRAMES):
+    """
+    Stream-mix cues into one 16-bit WAV, one block of frames at a time.
+
+    Only the block being written and one open reader per cue are held, so
+    memory does not grow with the length of the video.
+    """
+    sources = _open_sources(cues, sample_rate)
+    total = max((s["end"] for s in sources), default=0)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with wave.open(str(output_path), "wb") as out:
+        out.setnchannels(channels)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+
+        for block_start in range(0, total, block_frames):
+            block_end = min(block_start + block_frames, total)
+            mix = np.zeros((block_end - block_start, channels), dtype=np.float32)
+            for src in sources:
+                lo, hi = max(src["start"], block_start), min(src["end"], block_end)
+                if lo >= hi:
+                    continue
+                # Cues are read strictly forward, so readers never seek back
+                data = np.frombuffer(src["reader"].readframes(hi - lo), dtype="<i2")
+                data = data.reshape(-1, src["channels"]).astype(np.float32) * src["scale"]
+                if src["channels"] != channels:
+                    data = np.repeat(data.mean(axis=1, keepdims=True), channels, axis=1)
+                mix[lo - block_start:lo - block_start + len(data)] += data
+            out.writeframes(np.clip(mix, -32768, 32767).astype("<i2").tobytes())
+
+    for src in sources:
+        src["reader"].close()
+    print(f"🎚️ Mixed {len(sources)} cue(s) into {output_path} ({total / sample_rate:.1f}s)")
+    return output_path
+
+
+def mux_narration(video_path, narration_path, output_path):
+    """Attach the narration to the video; the video stream is copied, not re-encoded"""
+    subprocess.run([
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-i", str(video_path), "-i", str(narration_path),
+        "-map", "0:v:0", "-map", "1:a:0",
+        "-c:v", "copy", "-c:a", "aac", "-b:a", "192k",
+        str(output_path),
+    ], check=True)
+    print(f"🎬 Muxed narrated video: {output_path}")
+    return Path(output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mix a narration cue list and mux it into a video")
+    parser.add_argument("cues", help="cue list JSON written by CueRecorder")
+    parser.add_argument("video", help="silent video rendered by Manim")
+    parser.add_argument("-o", "--output", help="narrated video path (default: <video>_narrated.mp4)")
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    args = parser.parse_args()
+
+    video = Path(args.video)
+    narration = video.with_name(f"{video.stem}_narration.wav")
+    output = args.output or video.with_name(f"{video.stem}_narrated{video.suffix}")
+    mix_cues(load_cues(args.cues), narration, sample_rate=args.sample_rate)
+    mux_narration(video, narration, output)
+
+
+if __name__ == "__main__":
+    main()
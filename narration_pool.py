@@ -0,0 +1,73 @@
+"""
+Concurrent Narration Synthesis for Relativity Videos
+Runs TTS requests through a bounded asyncio worker pool so a batch of clips
+takes roughly as long as the slowest clip instead of the sum of all of them
+"""
+
+import asyncio
+import time
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 60.0  # seconds per attempt
+DEFAULT_RETRIES = 2     # extra attempts after the first failure
+DEFAULT_BACKOFF = 1.0   # seconds, doubled after every failed attempt
+
+
+class NarrationPool:
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, timeout=DEFAULT_TIMEOUT,
+                 retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.clip_times = {}
+        self.wall_time = 0.0
+
+    async def _run_one(self, semaphore, name, job):
+        """Run one job under the semaphore with timeout and retry/backoff"""
+        async with semaphore:
+            delay = self.backoff
+            for attempt in range(self.retries + 1):
+                start = time.perf_counter()
+                try:
+                    result = await asyncio.wait_for(job(), timeout=self.timeout)
+                    self.clip_times[name] = time.perf_counter() - start
+                    return result
+                except Exception as e:
+                    if attempt == self.retries:
+                        self.clip_times[name] = time.perf_counter() - start
+                        raise
+                    reason = "timed out" if isinstance(e, asyncio.TimeoutError) else e
+                    print(f"🔁 {name}: attempt {attempt + 1} failed ({reason}), "
+                          f"retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    delay *= 2
+
+    async def run(self, jobs):
+        """
+        Run {name: async callable} concurrently and return {name: result}.
+
+        A clip that still fails after all retries is reported and mapped to its
+        exception, so one bad line does not throw away the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        names = list(jobs)
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *(self._run_one(semaphore, name, jobs[name]) for name in names),
+            return_exceptions=True,
+        )
+        self.wall_time = time.perf_counter() - start
+
+        results = dict(zip(names, outcomes))
+        for name, outcome in results.items():
+            if isinstance(outcome, BaseException):
+                print(f"❌ {name}: {outcome!r}")
+        return results
+
+    def summary(self):
+        """Print wall-clock time against the summed per-clip time"""
+        summed = sum(self.clip_times.values())
+        speedup = summed / self.wall_time if self.wall_time > 0 else 1.0
+        print(f"⏱️ {len(self.clip_times)} clip(s) in {self.wall_time:.2f}s wall-clock "
+              f"vs {summed:.2f}s summed ({speedup:.1f}x, concurrency {self.concurrency})")
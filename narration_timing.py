@@ -0,0 +1,117 @@
+"""
+Audio-Driven Scene Timing for Relativity Videos
+Reads each narration clip's real duration once, caches it in a manifest, and
+waits only for whatever narration is left after the animations have played
+"""
+
+import json
+import wave
+from pathlib import Path
+
+from file_lock import file_lock, write_json_atomic
+
+DEFAULT_MANIFEST = Path("audio") / "durations.json"
+
+
+def probe_duration(path):
+    """Decode-free duration lookup: WAV header first, then PyAV, then pydub"""
+    path = str(path)
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError):
+        pass  # Not a PCM WAV (edge-tts MP3s used to be saved as .wav)
+
+    try:
+        import av  # Ships with Manim >= 0.18
+
+        with av.open(path) as container:
+            if container.duration is not None:
+                return container.duration / av.time_base
+            stream = container.streams.audio[0]
+            return float(stream.duration * stream.time_base)
+    except ImportError:
+        pass
+
+    from pydub import AudioSegment
+
+    return AudioSegment.from_file(path).duration_seconds
+
+
+class DurationManifest:
+    def __init__(self, manifest_path=DEFAULT_MANIFEST):
+        self.manifest_path = Path(manifest_path)
+        self.lock_path = self.manifest_path.with_suffix(".lock")
+        self.entries = self._load()
+
+    def _load(self):
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, key):
+        """Write one probed entry, keeping whatever other workers saved meanwhile"""
+        with file_lock(self.lock_path):
+            entries = self._load()
+            entries[key] = self.entries[key]
+            self.entries = entries
+            write_json_atomic(self.manifest_path, entries)
+
+    def duration(self, path):
+        """Seconds of audio in path, probed once per file version"""
+        path = Path(path)
+        stat = path.stat()
+        entry = self.entries.get(str(path))
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["duration"]
+
+        seconds = probe_duration(path)
+        self.entries[str(path)] = {
+            "duration": seconds,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        self._save(str(path))
+        return seconds
+
+
+class NarrationTimer:
+    """Tracks the clip a scene section started and how much of it is left"""
+
+    def __init__(self, scene, manifest=None, tail=0.5):
+        self.scene = scene
+        self.manifest = manifest or DurationManifest()
+        self.tail = tail  # breathing room after the last word
+        self.clip_end = None
+
+    def now(self):
+        return self.scene.renderer.time
+
+    def start(self, audio_path):
+        """Call right where add_sound(audio_path) is called"""
+        self.clip_end = self.now() + self.manifest.duration(audio_path)
+        return self.clip_end
+
+    def extend(self, duration):
+        """Keep the section going at least duration more seconds, e.g. for a clip with no audio"""
+        end = self.now() + duration
+        self.clip_end = end if self.clip_end is None else max(self.clip_end, end)
+        return self.clip_end
+
+    def remaining(self):
+        if self.clip_end is None:
+            return 0.0
+        return max(self.clip_end - self.now(), 0.0)
+
+    def wait_for_narration(self, min_wait=0.0):
+        """Replace a hardcoded self.wait(n) at the end of a narrated section"""
+        remaining = self.remaining()
+        pause = max(remaining + self.tail if remaining > 0 else 0.0, min_wait)
+        if pause > 0:
+            self.scene.wait(pause)
+        self.clip_end = None
+        return pause
@@ -0,0 +1,61 @@
+"""
+Relativistic Clocks for Relativity Videos
+A clock's hand angle is a function of one shared coordinate-time tracker and
+the clock's Lorentz factor, so any number of clocks stay consistent through
+a single continuous animation instead of a self.play(Rotate(...)) per tick
+(each of which used to become its own partial movie file)
+
+Usage inside a scene:
+    time = ValueTracker(0)
+    rest = RelativisticClock(time).shift(LEFT * 3)
+    moving = RelativisticClock(time, velocity=0.8).shift(RIGHT * 3)
+    self.play(Create(rest), Create(moving))
+    self.play(time.animate.increment_value(24), run_time=4, rate_func=linear)
+"""
+
+from manim import TAU, UP, WHITE, Circle, Line, VGroup, rotate_vector
+
+from relativity_physics import gamma
+
+
+class RelativisticClock(VGroup):
+    def __init__(self, time_tracker, velocity=0.0, radius=0.5, period=12.0, proper_time=None,
+                 color=WHITE, hand_color=WHITE, hand_length=0.75, stroke_width=4, **kwargs):
+        """
+        time_tracker: ValueTracker holding coordinate time (clock hours)
+        velocity: speed as a fraction of c; sets gamma for the default proper time
+        period: proper hours for one full turn of the hand
+        proper_time: optional callable mapping coordinate time to proper time,
+                     for clocks whose speed changes along the way
+        hand_length: as a fraction of the radius
+        """
+        super().__init__(**kwargs)
+        self.time_tracker = time_tracker
+        self.velocity = velocity
+        self.gamma = float(gamma(velocity))
+        self.period = period
+        self.proper_time_fn = proper_time
+        self.hand_length = hand_length * radius
+
+        self.face = Circle(radius=radius, color=color)
+        self.hand = Line(self.face.get_center(), self.face.get_center() + UP * self.hand_length,
+                         color=hand_color, stroke_width=stroke_width)
+        self.add(self.face, self.hand)
+        self.hand.add_updater(lambda hand: self.update_hand())
+
+    def proper_time(self):
+        """Time shown by this clock at the tracker's current coordinate time"""
+        t = self.time_tracker.get_value()
+        if self.proper_time_fn is not None:
+            return self.proper_time_fn(t)
+        return t / self.gamma
+
+    def hand_angle(self):
+        """Clockwise angle from twelve o'clock"""
+        return -TAU * self.proper_time() / self.period
+
+    def update_hand(self):
+        center = self.face.get_center()
+        tip = center + rotate_vector(UP * self.hand_length, self.hand_angle())
+        self.hand.put_start_and_end_on(center, tip)
+        return self
@@ -6,15 +6,26 @@ This version properly embeds audio into the final video file
 from manim import *
 import numpy as np
 import asyncio
-import edge_tts
 import os
 from pathlib import Path
+from audio_prep import prepare_audio
+from narration_cache import NarrationCache
+from narration_mixer import CueRecorder
+from narration_pool import NarrationPool
+from narration_timing import NarrationTimer
+from relativistic_clock import RelativisticClock
+from tts_backends import get_backend
 
 class RelativityWithRealAudio(Scene):
     def __init__(self):
         super().__init__()
         self.audio_dir = Path("audio")
         self.audio_dir.mkdir(exist_ok=True)
+        self.narration_cache = NarrationCache(self.audio_dir / ".cache")
+        self.backend = get_backend()  # Set RELATIVITY_TTS_BACKEND=pyttsx3 or fake offline
+        self.timer = NarrationTimer(self)
+        self.cues = CueRecorder(self)  # RELATIVITY_PREMIX=1 mixes narration after the render
+        self.narration_scripts = {}  # filename -> narration text, set by generate_all_audio
         
     def construct(self):
         """Main scene construction with embedded audio"""
@@ -35,6 +46,9 @@ class RelativityWithRealAudio(Scene):
         # Scene 4: Conclusion with audio
         self.conclusion_scene()
 
+    def render(self, preview=False):
+        return self.cues.render(super().render, preview)
+
     async def generate_all_audio(self):
         """Pre-generate all audio files before animation starts"""
         
@@ -62,22 +76,30 @@ class RelativityWithRealAudio(Scene):
                             we ever imagined."""
         }
         
+        self.narration_scripts = audio_scripts
         voice = "en-US-AriaNeural"  # Clear female voice
         
-        for filename, text in audio_scripts.items():
+        async def prepare(filename, text):
             audio_path = self.audio_dir / f"{filename}.wav"
             
-            if not audio_path.exists():
-                print(f"🎙️ Generating {filename}.wav...")
-                # Clean up text
-                clean_text = " ".join(text.split())
-                
-                # Generate audio
-                communicate = edge_tts.Communicate(clean_text, voice)
-                await communicate.save(str(audio_path))
-                print(f"✅ Created {filename}.wav")
+            # Cached by text + voice, so edited lines are regenerated
+            source, hit = await self.narration_cache.fetch_with(self.backend, text, None, voice)
+            
+            # Real PCM WAV, decoded once per source clip, so add_sound never sniffs MP3
+            await asyncio.to_thread(prepare_audio, source, audio_path)
+            if hit:
+                print(f"📁 Using cached {filename}.wav")
             else:
-                print(f"📁 Using existing {filename}.wav")
+                print(f"✅ Created {filename}.wav")
+        
+        # Synthesize all clips at once instead of one round-trip after another
+        pool = NarrationPool()
+        await pool.run({
+            filename: (lambda filename=filename, text=text: prepare(filename, text))
+            for filename, text in audio_scripts.items()
+        })
+        pool.summary()
+        self.narration_cache.report()
 
     def add_narration(self, filename):
         """Add audio file to the scene"""
@@ -85,10 +107,13 @@ class RelativityWithRealAudio(Scene):
         
         if audio_path.exists():
             print(f"🔊 Adding audio: {filename}.wav")
-            self.add_sound(str(audio_path))
+            self.cues.add_sound(audio_path)
+            self.timer.start(audio_path)
             return True
         else:
             print(f"⚠️ Audio file not found: {filename}.wav")
+            # No audio: hold the section for the narration's reading time instead
+            self.timer.extend(len(self.narration_scripts.get(filename, "").split()) * 0.5)
             return False
 
     def title_scene(self):
@@ -111,8 +136,8 @@ class RelativityWithRealAudio(Scene):
         
         self.play(Write(equation), run_time=2)
         
-        # Wait for audio to finish (adjust timing as needed)
-        self.wait(6)
+        # Wait only for whatever narration is still playing
+        self.timer.wait_for_narration()
         self.clear()
 
     def time_dilation_scene(self):
@@ -123,9 +148,10 @@ class RelativityWithRealAudio(Scene):
         title.to_edge(UP)
         self.play(Write(title))
         
-        # Create two clocks
-        clock1 = Circle(radius=0.8, color=BLUE).shift(LEFT * 3)
-        clock2 = Circle(radius=0.8, color=RED).shift(RIGHT * 3)
+        # Create two clocks driven by one shared coordinate time
+        time = ValueTracker(0)
+        clock1 = RelativisticClock(time, radius=0.8, color=BLUE).shift(LEFT * 3)
+        clock2 = RelativisticClock(time, velocity=0.9, radius=0.8, color=RED).shift(RIGHT * 3)
         
         # Labels
         label1 = Text("Stationary", font_size=16).next_to(clock1, DOWN)
@@ -134,26 +160,15 @@ class RelativityWithRealAudio(Scene):
         self.play(Create(clock1), Create(clock2))
         self.play(Write(label1), Write(label2))
         
-        # Clock hands
-        hand1 = Line(ORIGIN, UP * 0.6, color=WHITE).move_to(clock1.get_center())
-        hand2 = Line(ORIGIN, UP * 0.6, color=WHITE).move_to(clock2.get_center())
-        
-        self.play(Create(hand1), Create(hand2))
-        
-        # Animate time difference
-        for i in range(5):
-            self.play(
-                Rotate(hand1, PI/2, about_point=clock1.get_center()),
-                Rotate(hand2, PI/6, about_point=clock2.get_center()),  # Much slower
-                run_time=1.2
-            )
+        # Animate time difference: the moving clock runs slower by gamma
+        self.play(time.animate.increment_value(15), run_time=6, rate_func=linear)
         
         # Add explanation
         explanation = Text("Moving clocks run slower!", font_size=24, color=YELLOW)
         explanation.shift(DOWN * 2)
         self.play(Write(explanation))
         
-        self.wait(8)  # Wait for narration to finish
+        self.timer.wait_for_narration()
         self.clear()
 
     def energy_mass_scene(self):
@@ -193,7 +208,7 @@ class RelativityWithRealAudio(Scene):
         examples.shift(DOWN * 3)
         self.play(Write(examples))
         
-        self.wait(8)  # Wait for narration
+        self.timer.wait_for_narration()
         self.clear()
 
     def conclusion_scene(self):
@@ -236,7 +251,7 @@ class RelativityWithRealAudio(Scene):
         self.play(Write(quote))
         self.play(Write(attribution))
         
-        self.wait(10)  # Wait for narration to finish
+        self.timer.wait_for_narration()
 
 
 # Fallback version without audio
@@ -262,7 +277,7 @@ if __name__ == "__main__":
     print("="*55)
     print("\n🎵 This version creates videos WITH embedded audio!")
     print("\n📋 Requirements:")
-    print("   pip install edge-tts")
+    print("   pip install edge-tts   (or RELATIVITY_TTS_BACKEND=pyttsx3 offline)")
     print("\n🎯 Commands:")
     print("   python -m manim -pql relativity_audio_fixed.py RelativityWithRealAudio")
     print("   python -m manim -pql relativity_audio_fixed.py RelativityNoAudio")
@@ -270,5 +285,5 @@ if __name__ == "__main__":
     print("   • Pre-generates all audio files")
     print("   • Embeds audio directly in video")
     print("   • Professional narration")
-    print("   • Synchronized timing")
+    print("   • Scene timing driven by real narration length")
     print("\n🎬 Ready to create your narrated video!")
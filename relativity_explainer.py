@@ -12,42 +12,35 @@ This script creates an animated video explaining key concepts of Einstein's Theo
 
 from manim import *
 import numpy as np
+from relativistic_clock import RelativisticClock
+from relativity_physics import gamma, length_contraction
+from schwarzschild_orbits import GeodesicOrbit
+from spacetime_grid import WarpedGrid
 
 class RelativityExplainer(Scene):
+    # Segments in playback order; render_sections.py can render and cache them one by one
+    sections = [
+        "create_title",
+        "special_relativity_intro",
+        "time_dilation_demo",
+        "length_contraction_demo",
+        "energy_mass_equivalence",
+        "spacetime_curvature",
+        "conclusion",
+    ]
+
     def construct(self):
-        # Title Scene
-        self.create_title()
-        self.wait(2)
-        self.clear()
-        
-        # Introduction to Special Relativity
-        self.special_relativity_intro()
-        self.wait(2)
-        self.clear()
-        
-        # Time Dilation Animation
-        self.time_dilation_demo()
-        self.wait(2)
-        self.clear()
-        
-        # Length Contraction
-        self.length_contraction_demo()
-        self.wait(2)
-        self.clear()
-        
-        # E=mc² explanation
-        self.energy_mass_equivalence()
-        self.wait(2)
-        self.clear()
-        
-        # General Relativity - Spacetime Curvature
-        self.spacetime_curvature()
-        self.wait(2)
-        self.clear()
-        
-        # Conclusion
-        self.conclusion()
-        self.wait(3)
+        for name in self.sections:
+            self.play_section(name)
+
+    def play_section(self, name):
+        """Play one segment plus the pause that follows it"""
+        getattr(self, name)()
+        if name == self.sections[-1]:
+            self.wait(3)
+        else:
+            self.wait(2)
+            self.clear()
 
     def create_title(self):
         """Create animated title sequence"""
@@ -105,24 +98,15 @@ class RelativityExplainer(Scene):
         self.play(Create(stationary_frame), Create(moving_frame))
         self.play(Write(stationary_label), Write(moving_label))
         
-        # Add clocks
-        stationary_clock = Circle(radius=0.5, color=WHITE).move_to(stationary_frame.get_center())
-        moving_clock = Circle(radius=0.5, color=WHITE).move_to(moving_frame.get_center())
-        
-        # Clock hands
-        stat_hand = Line(ORIGIN, UP * 0.3, color=WHITE).move_to(stationary_clock.get_center())
-        mov_hand = Line(ORIGIN, UP * 0.3, color=WHITE).move_to(moving_clock.get_center())
+        # Add clocks driven by one shared coordinate time
+        time = ValueTracker(0)
+        stationary_clock = RelativisticClock(time).move_to(stationary_frame.get_center())
+        moving_clock = RelativisticClock(time, velocity=0.8).move_to(moving_frame.get_center())
         
         self.play(Create(stationary_clock), Create(moving_clock))
-        self.play(Create(stat_hand), Create(mov_hand))
         
         # Animate time dilation - stationary clock runs faster
-        for i in range(4):
-            self.play(
-                Rotate(stat_hand, PI/2, about_point=stationary_clock.get_center()),
-                Rotate(mov_hand, PI/4, about_point=moving_clock.get_center()),
-                run_time=0.5
-            )
+        self.play(time.animate.increment_value(12), run_time=2, rate_func=linear)
         
         # Add time dilation formula
         formula = MathTex(r"\Delta t' = \gamma \Delta t", font_size=32)
@@ -150,7 +134,7 @@ class RelativityExplainer(Scene):
         self.play(Create(rest_ruler), Write(rest_label))
         
         # Show the same ruler moving
-        moving_ruler = Rectangle(width=2.4, height=0.3, color=RED)  # Contracted by factor of 0.6
+        moving_ruler = Rectangle(width=length_contraction(4, 0.8), height=0.3, color=RED)  # v = 0.8c
         moving_ruler.shift(DOWN * 1)
         moving_label = Text("Same ruler moving: L = L₀/γ", font_size=20).next_to(moving_ruler, DOWN)
         
@@ -217,11 +201,7 @@ class RelativityExplainer(Scene):
         self.play(Write(title))
         
         # Create a grid representing spacetime
-        grid = NumberPlane(
-            x_range=[-4, 4, 1],
-            y_range=[-2, 2, 1],
-            background_line_style={"stroke_color": BLUE, "stroke_width": 1}
-        )
+        grid = WarpedGrid(x_range=(-4, 4), y_range=(-2, 2), spacing=0.5, stroke_opacity=1)
         
         self.play(Create(grid))
         
@@ -232,29 +212,17 @@ class RelativityExplainer(Scene):
         self.play(Create(sun), Write(sun_label))
         
         # Show how spacetime curves around the mass
-        # Create curved grid lines around the sun
-        def curve_function(x, y):
-            r = np.sqrt(x**2 + y**2)
-            if r < 0.1:  # Avoid division by zero
-                r = 0.1
-            factor = 1 + 0.5 / r  # Simplified curvature
-            return [x, y * factor]
-        
-        # Animate the curvature
-        curved_grid = grid.copy()
-        self.play(Transform(grid, curved_grid))
-        
-        # Add a planet following curved path
-        planet = Circle(radius=0.1, color=BLUE, fill_opacity=1).shift(RIGHT * 2)
-        planet_path = ParametricFunction(
-            lambda t: np.array([2 * np.cos(t), 1 * np.sin(t), 0]),
-            t_range=[0, 2*PI],
-            color=GREEN
-        )
+        grid.add_mass(sun, strength=0.5)
+        self.play(grid.warp_to(1), run_time=2)
+        
+        # Add a planet following a geodesic (its orbit precesses every lap)
+        orbit = GeodesicOrbit(periapsis=10, apoapsis=24, revolutions=3, size=2)
+        planet = Circle(radius=0.1, color=BLUE, fill_opacity=1).move_to(orbit.start())
+        planet_path = orbit.path(color=GREEN)
         
         self.play(Create(planet_path))
         self.play(Create(planet))
-        self.play(MoveAlongPath(planet, planet_path), run_time=3)
+        self.play(orbit.move(planet), run_time=6)
         
         # Einstein's field equation
         field_equation = MathTex(r"G_{\mu\nu} = \frac{8\pi G}{c^4} T_{\mu\nu}", font_size=24)
@@ -313,12 +281,12 @@ class RelativityCalculator(Scene):
         
         # Calculate and display results
         v = 0.8  # 80% speed of light
-        gamma = 1 / np.sqrt(1 - v**2)
+        lorentz = gamma(v)
         
         results = VGroup(
-            Text(f"Lorentz Factor (γ): {gamma:.2f}", font_size=20),
-            Text(f"Time Dilation: Time runs {gamma:.2f}x slower", font_size=20),
-            Text(f"Length Contraction: Length is {1/gamma:.2f}x shorter", font_size=20),
+            Text(f"Lorentz Factor (γ): {lorentz:.2f}", font_size=20),
+            Text(f"Time Dilation: Time runs {lorentz:.2f}x slower", font_size=20),
+            Text(f"Length Contraction: Length is {length_contraction(1, v):.2f}x shorter", font_size=20),
         ).arrange(DOWN, buff=0.3)
         
         results.shift(DOWN * 1)
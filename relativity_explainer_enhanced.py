@@ -10,44 +10,61 @@ This script creates a more comprehensive explainer video with:
 
 from manim import *
 import numpy as np
+from gravitational_lensing import LensRenderer
+from minkowski_diagram import MinkowskiDiagram
+from relativistic_clock import RelativisticClock
+from relativity_physics import velocity_addition
+from relativistic_sky import RelativisticSky
+from render_seed import section_rng
+from schwarzschild_orbits import GeodesicOrbit
+from spacetime_grid import WarpedGrid
+from starfield import Starfield
+from twin_trajectory import TwinTrip
 
 class EnhancedRelativityExplainer(Scene):
     """Enhanced version with narration and more detailed explanations"""
     
-    def construct(self):
+    # Independent segments in playback order. Each one starts from an empty
+    # screen, so render_sections.py can render them in parallel.
+    sections = [
+        "opening_sequence",
+        "historical_context",
+        "special_relativity_detailed",
+        "twin_paradox",
+        "relativistic_velocity_addition",
+        "general_relativity_detailed",
+        "real_world_applications",
+        "modern_implications",
+    ]
+
+    # Twin paradox trip; subclass with e.g. twin_speed = 0.99 to render a variant
+    twin_speed = 0.866  # fraction of c while coasting
+    twin_distance = 3.0  # light-years to the distant star
+    twin_accel_time = 0.4  # Earth years per acceleration phase
+
+    def setup(self):
         self.camera.background_color = "#001122"  # Dark space-like background
-        
+
+    def section_assets(self, name):
+        """Settings besides the section's source that change its frames"""
+        if name == "twin_paradox":
+            return [self.twin_speed, self.twin_distance, self.twin_accel_time]
+        return []
+
+    def construct(self):
         # Complete video sequence
-        self.opening_sequence()
-        self.wait(2)
-        self.clear()
-        
-        self.historical_context()
-        self.wait(2)
-        self.clear()
-        
-        self.special_relativity_detailed()
-        self.wait(2)
-        self.clear()
-        
-        self.twin_paradox()
-        self.wait(2)
-        self.clear()
-        
-        self.relativistic_velocity_addition()
-        self.wait(2)
-        self.clear()
-        
-        self.general_relativity_detailed()
-        self.wait(2)
-        self.clear()
-        
-        self.real_world_applications()
-        self.wait(2)
-        self.clear()
-        
-        self.modern_implications()
-        self.wait(3)
+        for name in self.sections:
+            self.play_section(name)
+
+    def play_section(self, name):
+        """Play one segment plus the pause that follows it"""
+        self.rng = section_rng(name)  # Same stars on every render of this section
+        getattr(self, name)()
+        if name == self.sections[-1]:
+            self.wait(3)
+        else:
+            self.wait(2)
+            self.clear()
 
     def opening_sequence(self):
         """Enhanced opening with space background and Einstein quote"""
@@ -83,20 +100,12 @@ class EnhancedRelativityExplainer(Scene):
         self.play(Write(quote), run_time=2)
         self.play(Write(author))
         
-    def create_starfield(self):
+    def create_starfield(self, n_stars=3000):
         """Create animated starfield background"""
-        stars = VGroup()
-        for _ in range(50):
-            star = Dot(
-                point=[
-                    np.random.uniform(-7, 7),
-                    np.random.uniform(-4, 4),
-                    0
-                ],
-                radius=np.random.uniform(0.01, 0.05),
-                color=WHITE
-            )
-            stars.add(star)
+        # One point cloud instead of a Dot per star, so a dense sky stays cheap
+        stars = Starfield(n_stars=n_stars, rng=self.rng)
+        stars.start_twinkle(amplitude=0.4)
+        stars.start_drift(LEFT * 0.05)
         return stars
 
     def historical_context(self):
@@ -233,12 +242,46 @@ class EnhancedRelativityExplainer(Scene):
         self.play(Write(speed_text1))
         self.wait(0.5)
         self.play(Write(speed_text2))
+        self.wait(1)
+        self.clear()
+        
+        # Spacetime view: switching to the moving observer's frame tilts every
+        # worldline, yet the light rays stay on the 45° lines
+        diagram = MinkowskiDiagram(x_range=(-4, 4), ct_range=(0, 4), unit=0.85)
+        diagram.shift(DOWN * 2.2)
+        diagram.add_frame_grid(spacing=0.25, color=BLUE, opacity=0.2)
+        diagram.add_observer(0, color=BLUE, stroke_width=4)
+        diagram.add_observer(0.6, color=RED, stroke_width=4)
+        emissions = [(0, 0), (0, 1), (0, 2)]
+        for event in emissions:
+            diagram.add_light_cone(event)
+        diagram.add_events(emissions, color=YELLOW, size=10)
+        
+        caption = Text("Stationary observer's spacetime", font_size=20, color=BLUE)
+        caption.to_edge(UP)
+        self.play(FadeIn(diagram), Write(caption))
+        
+        moving_caption = Text("Moving observer's spacetime: light still travels at c",
+                              font_size=20, color=RED).to_edge(UP)
+        self.play(diagram.boost_to(0.6), Transform(caption, moving_caption), run_time=3)
 
     def twin_paradox(self):
         """Illustrate the famous twin paradox"""
         title = Text("The Twin Paradox", font_size=36, color=PURPLE)
         title.to_edge(UP)
         
+        # The whole trip (acceleration, coasting, turnaround) is integrated once;
+        # everything below only looks values up by Earth time
+        trip = TwinTrip.round_trip(self.twin_speed, self.twin_distance, self.twin_accel_time)
+        time = ValueTracker(0)  # Earth years
+        
+        # The sky as the travelling twin sees it: crowding ahead and turning
+        # blue while the ship is fast
+        sky = RelativisticSky(lambda: abs(trip.velocity_at(time.get_value())), apex=RIGHT * 7)
+        stars = Starfield(n_stars=4000, x_range=(-12, 12), y_range=(-12, 12), rng=self.rng)
+        stars.set_transform(sky)
+        self.add(stars)
+        
         self.play(Write(title))
         
         # Setup: Two identical twins
@@ -257,49 +300,73 @@ class EnhancedRelativityExplainer(Scene):
         
         self.play(Create(star), Write(star_label))
         
+        # Time passes differently: Earth's clock shows Earth time, the ship's
+        # clock shows the integrated proper time
+        earth_clock = self.create_clock(time, earth.get_center() + UP * 1.5, "Earth Time")
+        space_clock = self.create_clock(time, twin_space.get_center() + UP * 1.5, "Space Time",
+                                        proper_time=trip.proper_time_at)
+        space_clock.add_updater(lambda m: m.next_to(twin_space, UP, buff=0.5))
+        self.play(FadeIn(earth_clock), FadeIn(space_clock))
+        
         # Journey animation
         journey_path = Line(earth.get_center(), star.get_center(), color=RED)
         self.play(Create(journey_path))
         
-        # Space twin travels at high speed
-        self.play(
-            twin_space.animate.move_to(star.get_center()),
-            run_time=2
-        )
+        # Space twin follows the precomputed trajectory while both clocks run
+        def ship_position(t):
+            fraction = trip.position_at(t) / self.twin_distance
+            return earth.get_center() + fraction * (star.get_center() - earth.get_center())
         
-        # Time passes differently
-        earth_clock = self.create_clock(earth.get_center() + UP * 1.5, "Earth Time")
-        space_clock = self.create_clock(star.get_center() + UP * 1.5, "Space Time")
-        
-        # Show time dilation during journey
-        for i in range(5):
-            self.play(
-                Rotate(earth_clock[1], PI/3),  # Earth clock ticks faster
-                Rotate(space_clock[1], PI/6),  # Space clock ticks slower
-                run_time=0.4
-            )
+        twin_space.add_updater(lambda m: m.move_to(ship_position(time.get_value())))
+        turnaround = trip.turnaround_time()
+        self.play(time.animate.set_value(turnaround), run_time=2.5, rate_func=linear)
         
         # Return journey
         return_path = Line(star.get_center(), earth.get_center(), color=ORANGE)
         self.play(Create(return_path))
-        self.play(
-            twin_space.animate.move_to(earth.get_center()),
-            run_time=2
-        )
+        sky.apex = LEFT * 7  # Heading home
+        self.play(time.animate.set_value(trip.duration), run_time=2.5, rate_func=linear)
+        twin_space.clear_updaters()
         
         # Final comparison
-        age_diff = Text("Space twin is younger!", font_size=24, color=YELLOW)
+        age_diff = Text(f"Space twin is younger by {trip.age_gap():.1f} years!",
+                        font_size=24, color=YELLOW)
         age_diff.shift(DOWN * 2)
         self.play(Write(age_diff))
+        self.wait(1)
+        self.clear()
+        
+        # The same trip as worldlines, with a dot for every year each twin ages
+        diagram = MinkowskiDiagram(x_range=(-3, 5), ct_range=(0, trip.duration + 0.5),
+                                   unit=5.5 / (trip.duration + 0.5))
+        diagram.shift(DOWN * 2.8 + LEFT * 0.7)
+        diagram.add_frame_grid(spacing=0.5, color=BLUE, opacity=0.2)
+        diagram.add_worldline([(0, 0), (0, trip.duration)], color=BLUE, stroke_width=4)
+        diagram.add_worldline(trip.worldline(), color=GREEN, stroke_width=4)
+        earth_years = np.arange(0, trip.duration, 1.0)
+        diagram.add_events(np.column_stack([np.zeros_like(earth_years), earth_years]),
+                           color=BLUE, size=10)
+        diagram.add_events(trip.age_ticks(1.0), color=GREEN, size=10)
+        
+        caption = Text("Earth frame: one dot per year of each twin's age", font_size=18)
+        caption.to_edge(UP)
+        self.play(FadeIn(diagram), Write(caption))
+        
+        # Re-draw the diagram from each leg of the trip: the traveller's frame changes
+        v = self.twin_speed
+        outbound = Text("Outbound ship frame", font_size=18, color=GREEN).to_edge(UP)
+        inbound = Text("Inbound ship frame", font_size=18, color=GREEN).to_edge(UP)
+        self.play(diagram.boost_to(v), Transform(caption, outbound), run_time=2)
+        self.play(diagram.boost_to(-v), Transform(caption, inbound), run_time=2)
+        self.play(diagram.boost_to(0), FadeOut(caption), run_time=1.5)
 
-    def create_clock(self, position, label):
-        """Create a visual clock"""
-        clock_circle = Circle(radius=0.4, color=WHITE).move_to(position)
-        clock_hand = Line(ORIGIN, UP * 0.3, color=RED).move_to(position)
-        clock_label = Text(label, font_size=12).next_to(clock_circle, UP, buff=0.1)
-        
-        self.play(Create(clock_circle), Create(clock_hand), Write(clock_label))
-        return VGroup(clock_circle, clock_hand, clock_label)
+    def create_clock(self, time, position, label, velocity=0.0, proper_time=None):
+        """Create a labelled clock whose hand follows the coordinate-time tracker"""
+        clock = RelativisticClock(time, velocity=velocity, proper_time=proper_time, period=2.0,
+                                  radius=0.4, hand_color=RED)
+        clock.move_to(position)
+        clock_label = Text(label, font_size=12).next_to(clock, UP, buff=0.1)
+        return VGroup(clock, clock_label)
 
     def relativistic_velocity_addition(self):
         """Show how velocities add in relativity"""
@@ -332,7 +399,8 @@ class EnhancedRelativityExplainer(Scene):
             Text("Example: Two spaceships approaching each other", font_size=18),
             Text("Each traveling at 0.8c relative to Earth", font_size=18),
             Text("Classical: v = 0.8c + 0.8c = 1.6c (IMPOSSIBLE!)", font_size=16, color=RED),
-            Text("Relativistic: v = (0.8c + 0.8c)/(1 + 0.64) = 0.976c ✓", font_size=16, color=GREEN),
+            Text(f"Relativistic: v = (0.8c + 0.8c)/(1 + 0.64) = {velocity_addition(0.8, 0.8):.3f}c ✓",
+                 font_size=16, color=GREEN),
         ).arrange(DOWN, buff=0.3)
         
         example.shift(DOWN * 1.5)
@@ -375,11 +443,7 @@ class EnhancedRelativityExplainer(Scene):
         self.play(Write(title))
         
         # Create flat spacetime grid
-        grid = NumberPlane(
-            x_range=[-6, 6, 1],
-            y_range=[-3, 3, 1],
-            background_line_style={"stroke_color": BLUE, "stroke_width": 1, "stroke_opacity": 0.6}
-        )
+        grid = WarpedGrid(x_range=(-6, 6), y_range=(-3, 3), spacing=0.5)
         
         self.play(Create(grid))
         
@@ -389,33 +453,21 @@ class EnhancedRelativityExplainer(Scene):
         
         self.play(Create(mass), Write(mass_label))
         
-        # Show curvature effect
-        curved_lines = VGroup()
-        for x in range(-3, 4):
-            for y in range(-2, 3):
-                if x**2 + y**2 > 1:  # Don't draw lines inside the mass
-                    r = np.sqrt(x**2 + y**2)
-                    curve_factor = 0.5 / r
-                    start = np.array([x, y, 0])
-                    end = np.array([x, y - curve_factor, 0])
-                    curved_line = Line(start, end, color=BLUE, stroke_width=1)
-                    curved_lines.add(curved_line)
+        # Show curvature effect: the whole sheet sags toward the star
+        grid.add_mass(mass, strength=0.6)
+        self.play(grid.warp_to(1), run_time=2)
         
-        self.play(Transform(grid, curved_lines))
+        # Orbital path: a Schwarzschild geodesic, precessing each lap
+        orbit = GeodesicOrbit(periapsis=10, apoapsis=24, revolutions=3, size=2.8)
+        orbit_path = orbit.path(color=GREEN)
         
         # Add orbiting object
-        planet = Circle(radius=0.15, color=BLUE, fill_opacity=1).shift(RIGHT * 3)
-        
-        # Orbital path
-        orbit_path = ParametricFunction(
-            lambda t: np.array([3*np.cos(t), 1.5*np.sin(t), 0]),
-            t_range=[0, 2*PI],
-            color=GREEN
-        )
+        planet = Circle(radius=0.15, color=BLUE, fill_opacity=1).move_to(orbit.start())
         
         self.play(Create(orbit_path))
         self.play(Create(planet))
-        self.play(MoveAlongPath(planet, orbit_path), run_time=4)
+        grid.add_mass(planet, strength=0.05)  # The planet's own small dent travels with it
+        self.play(orbit.move(planet), run_time=6)
         
         # Explanation
         explanation = Text("Planet follows the 'straightest' path in curved spacetime",
@@ -508,27 +560,15 @@ class EnhancedRelativityExplainer(Scene):
 
     def black_hole_demo(self):
         """Demonstrate black hole spacetime curvature"""
-        # Extreme curvature visualization
-        black_hole = Circle(radius=0.5, color=BLACK, fill_opacity=1)
-        event_horizon = Circle(radius=0.5, color=WHITE, fill_opacity=0)
-        
-        self.play(Create(event_horizon), Create(black_hole))
-        
-        # Light bending
-        light_paths = VGroup()
-        for angle in [PI/4, PI/2, 3*PI/4]:
-            path = ParametricFunction(
-                lambda t: np.array([
-                    2*np.cos(angle) * (1-t) + 0.6*np.cos(angle + PI/2) * t,
-                    2*np.sin(angle) * (1-t) + 0.6*np.sin(angle + PI/2) * t,
-                    0
-                ]),
-                t_range=[0, 1],
-                color=YELLOW
-            )
-            light_paths.add(path)
-        
-        self.play(Create(light_paths))
+        # Ray-traced sky behind the text: the black hole drifts in front of a
+        # distant galaxy until the galaxy's light wraps into an Einstein ring
+        lens = LensRenderer(einstein_radius=1.0, galaxy=(0, -2),
+                            seed=int(self.rng.integers(2**31)))
+        view, drift = lens.move_lens(np.array([-5, -2, 0]), np.array([0, -2, 0]), run_time=3)
+        
+        self.bring_to_back(view)
+        self.play(FadeIn(view))
+        self.play(drift)
 
     def modern_implications(self):
         """Discuss modern implications and future"""
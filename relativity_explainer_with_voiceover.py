@@ -9,11 +9,17 @@ key concepts of Einstein's Theory of Relativity.
 from manim import *
 import numpy as np
 import asyncio
-import edge_tts
 import pygame
 import os
 from pathlib import Path
 import tempfile
+from audio_prep import prepare_audio
+from narration_cache import NarrationCache
+from narration_mixer import CueRecorder
+from relativistic_clock import RelativisticClock
+from relativity_physics import gamma, length_contraction, rest_energy
+from schwarzschild_orbits import GeodesicOrbit
+from tts_backends import get_backend
 
 class VoiceoverRelativityExplainer(Scene):
     def __init__(self):
@@ -26,49 +32,48 @@ class VoiceoverRelativityExplainer(Scene):
         self.voice = "en-US-AriaNeural"  # Microsoft Edge TTS voice
         self.rate = "+0%"  # Speech rate
         self.volume = "+0%"  # Volume
-        
+        self.narration_cache = NarrationCache(self.audio_dir / ".cache")
+        self.backend = get_backend()  # Set RELATIVITY_TTS_BACKEND=pyttsx3 or fake offline
+        self.cues = CueRecorder(self)  # RELATIVITY_PREMIX=1 mixes narration after the render
+        
+    # Segments in playback order; render_sections.py can render and cache them one by one
+    sections = [
+        "create_title_with_voiceover",
+        "special_relativity_intro_with_voiceover",
+        "time_dilation_demo_with_voiceover",
+        "length_contraction_demo_with_voiceover",
+        "energy_mass_equivalence_with_voiceover",
+        "spacetime_curvature_with_voiceover",
+        "conclusion_with_voiceover",
+    ]
+
     def construct(self):
-        # Title Scene with Voiceover
-        self.create_title_with_voiceover()
-        self.wait(3)
-        self.clear()
-        
-        # Introduction to Special Relativity
-        self.special_relativity_intro_with_voiceover()
-        self.wait(3)
-        self.clear()
-        
-        # Time Dilation Animation
-        self.time_dilation_demo_with_voiceover()
-        self.wait(3)
-        self.clear()
-        
-        # Length Contraction
-        self.length_contraction_demo_with_voiceover()
-        self.wait(3)
-        self.clear()
-        
-        # E=mc² explanation
-        self.energy_mass_equivalence_with_voiceover()
-        self.wait(3)
-        self.clear()
-        
-        # General Relativity - Spacetime Curvature
-        self.spacetime_curvature_with_voiceover()
-        self.wait(3)
-        self.clear()
-        
-        # Conclusion
-        self.conclusion_with_voiceover()
-        self.wait(4)
+        for name in self.sections:
+            self.play_section(name)
+
+    def play_section(self, name):
+        """Play one segment plus the pause that follows it"""
+        getattr(self, name)()
+        if name == self.sections[-1]:
+            self.wait(4)
+        else:
+            self.wait(3)
+            self.clear()
+
+    def section_assets(self, name):
+        """Everything besides the section's source that changes its narration audio"""
+        return [self.voice, self.rate, self.volume, self.backend.name]
+
+    def render(self, preview=False):
+        return self.cues.render(super().render, preview)
 
     async def generate_speech(self, text, filename):
-        """Generate speech audio file using Edge TTS"""
-        audio_path = self.audio_dir / f"{filename}.mp3"
+        """Generate speech audio file using the configured TTS backend"""
+        audio_path = self.audio_dir / f"{filename}{self.backend.suffix}"
         
-        if not audio_path.exists():
-            communicate = edge_tts.Communicate(text, self.voice, rate=self.rate, volume=self.volume)
-            await communicate.save(str(audio_path))
+        # Only re-synthesizes when text, voice, rate, volume or backend changed
+        await self.narration_cache.fetch_with(self.backend, text, audio_path, self.voice,
+                                              rate=self.rate, volume=self.volume)
         
         return str(audio_path)
 
@@ -78,9 +83,9 @@ class VoiceoverRelativityExplainer(Scene):
             # Generate audio file
             audio_path = asyncio.run(self.generate_speech(text, filename))
             
-            # Actually add the audio to the scene
-            print(f"🔊 Adding audio: {filename}.mp3")
-            self.add_sound(audio_path)
+            # Actually add the audio to the scene, as PCM decoded once per clip
+            print(f"🔊 Adding audio: {Path(audio_path).name}")
+            self.cues.add_sound(prepare_audio(audio_path))
             
             # Also print for debugging
             print(f"📝 NARRATION: {text[:100]}...")
@@ -166,36 +171,28 @@ class VoiceoverRelativityExplainer(Scene):
         self.play(Create(stationary_frame), Create(moving_frame))
         self.play(Write(stationary_label), Write(moving_label))
         
-        # Add clocks
-        stationary_clock = Circle(radius=0.5, color=WHITE).move_to(stationary_frame.get_center())
-        moving_clock = Circle(radius=0.5, color=WHITE).move_to(moving_frame.get_center())
-        
-        # Clock hands
-        stat_hand = Line(ORIGIN, UP * 0.3, color=WHITE).move_to(stationary_clock.get_center())
-        mov_hand = Line(ORIGIN, UP * 0.3, color=WHITE).move_to(moving_clock.get_center())
+        # Add clocks driven by one shared coordinate time
+        time = ValueTracker(0)
+        stationary_clock = RelativisticClock(time).move_to(stationary_frame.get_center())
+        moving_clock = RelativisticClock(time, velocity=0.8).move_to(moving_frame.get_center())
         
         self.play(Create(stationary_clock), Create(moving_clock))
-        self.play(Create(stat_hand), Create(mov_hand))
         
         # Animate time dilation
-        for i in range(6):
-            self.play(
-                Rotate(stat_hand, PI/2, about_point=stationary_clock.get_center()),
-                Rotate(mov_hand, PI/4, about_point=moving_clock.get_center()),
-                run_time=0.8
-            )
+        self.play(time.animate.increment_value(18), run_time=4.8, rate_func=linear)
         
         # Add formula explanation
-        formula_narration = """The mathematical relationship is given by the time dilation formula, 
+        gamma_08 = gamma(0.8)
+        formula_narration = f"""The mathematical relationship is given by the time dilation formula, 
                              where gamma is the Lorentz factor. For an object moving at 80% the speed of light, 
-                             gamma equals 1.67, meaning time runs 67% slower."""
+                             gamma equals {gamma_08:.2f}, meaning time runs {(gamma_08 - 1) * 100:.0f}% slower."""
         
         self.play_audio_sync(formula_narration, "time_dilation_formula")
         
         # Use Text instead of MathTex to avoid LaTeX issues
         formula = Text("Δt' = γΔt", font_size=32, color=YELLOW)
         gamma_formula = Text("γ = 1/√(1-v²/c²)", font_size=24, color=YELLOW)
-        gamma_value = Text("For v=0.8c: γ = 1.67", font_size=20, color=GREEN)
+        gamma_value = Text(f"For v=0.8c: γ = {gamma_08:.2f}", font_size=20, color=GREEN)
         
         formula.shift(DOWN * 1.5)
         gamma_formula.next_to(formula, DOWN, buff=0.3)
@@ -207,10 +204,10 @@ class VoiceoverRelativityExplainer(Scene):
 
     def length_contraction_demo_with_voiceover(self):
         """Demonstrate length contraction with narration"""
-        narration = """Another fascinating effect is length contraction. Objects moving at high speeds 
+        narration = f"""Another fascinating effect is length contraction. Objects moving at high speeds 
                       appear shorter in the direction of motion when observed from a stationary frame. 
                       Here we see a ruler that is 8 units long at rest, but when moving at 80% the speed of light, 
-                      it appears to contract to only 4.8 units."""
+                      it appears to contract to only {length_contraction(8, 0.8):.1f} units."""
         
         self.play_audio_sync(narration, "length_contraction")
         
@@ -227,11 +224,11 @@ class VoiceoverRelativityExplainer(Scene):
         self.play(Create(rest_ruler), Write(rest_label))
         
         # Contracted ruler
-        gamma = 1/np.sqrt(1-0.8**2)
-        contracted_length = 4 / gamma  # Visual scaling
+        contracted_length = length_contraction(4, 0.8)  # Visual scaling
         moving_ruler = Rectangle(width=contracted_length, height=0.3, color=RED)
         moving_ruler.shift(DOWN * 1)
-        moving_label = Text(f"Same ruler moving: L = {8/gamma:.1f} units", font_size=18).next_to(moving_ruler, DOWN)
+        moving_label = Text(f"Same ruler moving: L = {length_contraction(8, 0.8):.1f} units",
+                            font_size=18).next_to(moving_ruler, DOWN)
         
         # Motion lines
         motion_lines = VGroup(*[
@@ -249,10 +246,11 @@ class VoiceoverRelativityExplainer(Scene):
 
     def energy_mass_equivalence_with_voiceover(self):
         """Explain E=mc² with narration"""
-        narration = """Perhaps Einstein's most famous equation is E equals MC squared. 
+        gram_energy = rest_energy(1e-3) / 1e12  # trillion joules
+        narration = f"""Perhaps Einstein's most famous equation is E equals MC squared. 
                       This reveals that mass and energy are equivalent - even a tiny amount of mass 
                       contains an enormous amount of energy. One gram of matter, if completely converted 
-                      to energy, would release 90 trillion joules - enough to power a large city for hours."""
+                      to energy, would release {gram_energy:.0f} trillion joules - enough to power a large city for hours."""
         
         self.play_audio_sync(narration, "energy_mass")
         
@@ -273,7 +271,7 @@ class VoiceoverRelativityExplainer(Scene):
             Text("E = Energy", font_size=24),
             Text("m = Mass", font_size=24),
             Text("c = Speed of light", font_size=24),
-            Text("1 gram = 90 trillion joules!", font_size=18, color=YELLOW)
+            Text(f"1 gram = {gram_energy:.0f} trillion joules!", font_size=18, color=YELLOW)
         ).arrange(DOWN, buff=0.3)
         explanation.shift(DOWN * 2)
         
@@ -324,19 +322,16 @@ class VoiceoverRelativityExplainer(Scene):
         
         self.play(Create(sun), Write(sun_label))
         
-        # Orbital path
-        planet_path = ParametricFunction(
-            lambda t: np.array([2.5 * np.cos(t), 1.2 * np.sin(t), 0]),
-            t_range=[0, 2*PI],
-            color=GREEN
-        )
+        # Orbital path: a Schwarzschild geodesic, precessing each lap
+        orbit = GeodesicOrbit(periapsis=10, apoapsis=24, revolutions=3, size=2.2)
+        planet_path = orbit.path(color=GREEN)
         
         self.play(Create(planet_path))
         
         # Planet
-        planet = Circle(radius=0.15, color=BLUE, fill_opacity=1).shift(RIGHT * 2.5)
+        planet = Circle(radius=0.15, color=BLUE, fill_opacity=1).move_to(orbit.start())
         self.play(Create(planet))
-        self.play(MoveAlongPath(planet, planet_path), run_time=4)
+        self.play(orbit.move(planet), run_time=6)
         
         # Field equation
         field_equation = Text("Gμν = (8πG/c⁴)Tμν", font_size=18, color=YELLOW)
@@ -0,0 +1,149 @@
+"""
+Special Relativity Kernels for Relativity Videos
+One place for every number the scenes, narration and calculators show.
+All functions take scalars or NumPy arrays of speeds as fractions of c
+(beta) and broadcast like ufuncs. Near v -> c they use 1 - beta^2 =
+(1 - beta)(1 + beta), which keeps full precision where the textbook form
+cancels to zero
+
+Usage:
+    from relativity_physics import gamma, length_contraction
+    gamma(0.8)                        # 1.666...
+    length_contraction(8, 0.8)        # 4.8
+    python relativity_physics.py      # throughput benchmark on 10^7 speeds
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+C = 299_792_458.0  # m/s
+
+
+def _beta(beta):
+    return np.asarray(beta, dtype=float)
+
+
+def inverse_gamma(beta):
+    """sqrt(1 - beta^2): 1 at rest, 0 at the speed of light"""
+    b = np.abs(_beta(beta))
+    return np.sqrt((1.0 - b) * (1.0 + b))
+
+
+def gamma(beta):
+    """Lorentz factor 1 / sqrt(1 - beta^2)"""
+    return 1.0 / inverse_gamma(beta)
+
+
+def gamma_minus_one(beta):
+    """gamma - 1 without cancellation at low speeds"""
+    b = _beta(beta)
+    s = inverse_gamma(b)
+    return b * b / (s * (1.0 + s))
+
+
+def time_dilation(proper_time, beta):
+    """Coordinate time that passes while a clock moving at beta ticks proper_time"""
+    return np.asarray(proper_time, dtype=float) * gamma(beta)
+
+
+def proper_time(coordinate_time, beta):
+    """Time a clock moving at beta shows after coordinate_time"""
+    return np.asarray(coordinate_time, dtype=float) * inverse_gamma(beta)
+
+
+def length_contraction(rest_length, beta):
+    """Length measured for a ruler of rest_length moving at beta"""
+    return np.asarray(rest_length, dtype=float) * inverse_gamma(beta)
+
+
+def velocity_addition(u, v):
+    """Collinear composition of two speeds (fractions of c)"""
+    u, v = _beta(u), _beta(v)
+    return (u + v) / (1.0 + u * v)
+
+
+def rapidity(beta):
+    """Additive boost parameter: rapidity(velocity_addition(u, v)) = rapidity(u) + rapidity(v)"""
+    return np.arctanh(_beta(beta))
+
+
+def beta_from_rapidity(phi):
+    return np.tanh(np.asarray(phi, dtype=float))
+
+
+def doppler_factor(beta, angle=0.0):
+    """
+    Observed / emitted frequency for a source moving at beta whose light
+    arrives at `angle` from its direction of motion (observer frame).
+    angle = 0 is a head-on approach: sqrt((1 + beta) / (1 - beta))
+    """
+    b = _beta(beta)
+    return inverse_gamma(b) / (1.0 - b * np.cos(angle))
+
+
+def aberration(cos_theta, beta):
+    """
+    cos of a star's apparent angle from the direction of motion, seen by an
+    observer moving at beta, given cos_theta in the star's rest frame
+    """
+    c, b = np.asarray(cos_theta, dtype=float), _beta(beta)
+    return (c + b) / (1.0 + b * c)
+
+
+def rest_energy(mass, c=C):
+    return np.asarray(mass, dtype=float) * c ** 2
+
+
+def total_energy(mass, beta, c=C):
+    return rest_energy(mass, c) * gamma(beta)
+
+
+def kinetic_energy(mass, beta, c=C):
+    """(gamma - 1) m c^2, accurate from walking pace to ultra-relativistic speeds"""
+    return rest_energy(mass, c) * gamma_minus_one(beta)
+
+
+def momentum(mass, beta, c=C):
+    return np.asarray(mass, dtype=float) * c * _beta(beta) * gamma(beta)
+
+
+KERNELS = {
+    "gamma": gamma,
+    "time_dilation": lambda b: time_dilation(1.0, b),
+    "length_contraction": lambda b: length_contraction(1.0, b),
+    "velocity_addition": lambda b: velocity_addition(b, 0.5),
+    "rapidity": rapidity,
+    "doppler_factor": doppler_factor,
+    "aberration": lambda b: aberration(b, 0.5),
+    "kinetic_energy": lambda b: kinetic_energy(1.0, b),
+}
+
+
+def benchmark(n=10_000_000, repeats=3, seed=0):
+    """Time every kernel on n random speeds and print elements per second"""
+    betas = np.random.default_rng(seed).uniform(0.0, 1.0 - 1e-12, n)
+    print(f"⚡ Relativity kernels on {n:,} speeds (best of {repeats})")
+    results = {}
+    for name, kernel in KERNELS.items():
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            kernel(betas)
+            best = min(best, time.perf_counter() - start)
+        results[name] = n / best
+        print(f"   {name:<20} {best * 1000:8.1f} ms  {n / best / 1e6:8.1f} M/s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the relativity kernels")
+    parser.add_argument("-n", type=int, default=10_000_000, help="array length (default: 10^7)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    benchmark(args.n, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,34 @@
 """
 Einstein's Relativity Video with Audio and Professional Subtitles
-This version includes synchronized narration and on-screen subtitles
+This version includes synchronized narration and on-screen subtitles.
+Subtitles run on their own track (subtitle_track.py), timed from the
+narration's word boundaries, while the visuals animate underneath
 """
 
 from manim import *
 import numpy as np
 import asyncio
-import edge_tts
 import os
 from pathlib import Path
+from audio_prep import prepare_audio
+from narration_cache import NarrationCache
+from narration_pool import NarrationPool
+from narration_timing import NarrationTimer
+from relativistic_clock import RelativisticClock
+from relativity_physics import rest_energy
+from subtitle_track import SubtitleTrack
+from tts_backends import get_backend
 
 class RelativityWithSubtitles(Scene):
     def __init__(self):
         super().__init__()
         self.audio_dir = Path("audio")
         self.audio_dir.mkdir(exist_ok=True)
+        self.narration_cache = NarrationCache(self.audio_dir / ".cache")
+        self.backend = get_backend()  # Set RELATIVITY_TTS_BACKEND=pyttsx3 or fake offline
+        self.timer = NarrationTimer(self)
+        self.word_timings = {}  # filename -> [[offset, duration, word], ...] or None
+        self.subtitles = SubtitleTrack()  # Own clock; holds no reference to the scene
         
     def construct(self):
         """Main scene with audio and subtitles"""
@@ -50,66 +64,37 @@ class RelativityWithSubtitles(Scene):
         
         voice = "en-US-AriaNeural"
         
-        for filename, text in audio_scripts.items():
-            audio_path = self.audio_dir / f"{filename}.wav"
-            if not audio_path.exists():
-                print(f"🎙️ Generating {filename}.wav...")
-                communicate = edge_tts.Communicate(text, voice)
-                await communicate.save(str(audio_path))
+        async def prepare(filename, text):
+            # Word timings come from the same TTS request (or cache entry) as the audio
+            source, _, words = await self.narration_cache.fetch_timed(self.backend, text, None, voice)
+            self.word_timings[filename] = words
+            # Real PCM WAV, decoded once per source clip, so add_sound never sniffs MP3
+            await asyncio.to_thread(prepare_audio, source, self.audio_dir / f"{filename}.wav")
+        
+        pool = NarrationPool()
+        await pool.run({
+            filename: (lambda filename=filename, text=text: prepare(filename, text))
+            for filename, text in audio_scripts.items()
+        })
+        pool.summary()
+        self.narration_cache.report()
 
     def add_narration_with_subtitles(self, filename, subtitle_text):
-        """Add audio and display subtitles"""
+        """Start the narration and schedule its subtitles; returns immediately"""
         audio_path = self.audio_dir / f"{filename}.wav"
         
         if audio_path.exists():
             print(f"🔊 Adding audio: {filename}.wav")
             self.add_sound(str(audio_path))
-        
-        # Show subtitles
-        self.display_subtitle_sequence(subtitle_text)
-
-    def display_subtitle_sequence(self, text):
-        """Display subtitles in chunks"""
-        # Split text into readable chunks
-        sentences = text.replace('. ', '.|').split('|')
-        
-        for sentence in sentences:
-            if sentence.strip():
-                self.show_subtitle(sentence.strip())
-
-    def show_subtitle(self, text):
-        """Show a single subtitle with professional styling"""
-        # Create subtitle text
-        subtitle = Text(
-            text,
-            font_size=18,
-            color=WHITE,
-            weight=NORMAL,
-            font="Arial"
-        )
-        
-        # Create semi-transparent background
-        padding = 0.3
-        bg = Rectangle(
-            width=min(subtitle.width + padding * 2, 12),
-            height=subtitle.height + padding,
-            fill_color=BLACK,
-            fill_opacity=0.8,
-            stroke_color=WHITE,
-            stroke_width=1,
-            stroke_opacity=0.3
-        )
-        
-        # Group subtitle with background
-        subtitle_group = VGroup(bg, subtitle)
-        subtitle_group.to_edge(DOWN, buff=0.8)
-        
-        # Animate subtitle appearance
-        duration = len(text.split()) * 0.5  # Reading time
-        
-        self.play(FadeIn(subtitle_group), run_time=0.5)
-        self.wait(max(duration - 1, 1))
-        self.play(FadeOut(subtitle_group), run_time=0.5)
+            duration = self.timer.start(audio_path) - self.timer.now()
+        else:
+            # No audio: the subtitles get their reading time and the section waits for it
+            duration = len(subtitle_text.split()) * 0.5
+            self.timer.extend(duration)
+        
+        # Cues follow the spoken words while the section's visuals play
+        self.subtitles.add_clip(self.word_timings.get(filename), duration, subtitle_text)
+        self.add(self.subtitles)
 
     def title_scene_with_subtitles(self):
         """Title scene with narration and subtitles"""
@@ -131,7 +116,7 @@ class RelativityWithSubtitles(Scene):
         equation.shift(DOWN * 2)
         
         self.play(Write(equation), run_time=2)
-        self.wait(4)  # Wait for narration to finish
+        self.timer.wait_for_narration()
         self.clear()
 
     def time_dilation_with_subtitles(self):
@@ -144,9 +129,12 @@ class RelativityWithSubtitles(Scene):
         title.to_edge(UP)
         self.play(Write(title))
         
-        # Create clocks
-        clock1 = Circle(radius=0.8, color=BLUE, stroke_width=3).shift(LEFT * 3)
-        clock2 = Circle(radius=0.8, color=RED, stroke_width=3).shift(RIGHT * 3)
+        # Create clocks driven by one shared coordinate time
+        time = ValueTracker(0)
+        clock1 = RelativisticClock(time, radius=0.8, color=BLUE).shift(LEFT * 3)
+        clock2 = RelativisticClock(time, velocity=0.9, radius=0.8, color=RED).shift(RIGHT * 3)
+        clock1.face.set_stroke(width=3)
+        clock2.face.set_stroke(width=3)
         
         # Clock labels
         label1 = Text("Stationary Clock", font_size=16, color=BLUE).next_to(clock1, DOWN)
@@ -155,26 +143,15 @@ class RelativityWithSubtitles(Scene):
         self.play(Create(clock1), Create(clock2))
         self.play(Write(label1), Write(label2))
         
-        # Clock hands
-        hand1 = Line(ORIGIN, UP * 0.6, color=WHITE, stroke_width=4).move_to(clock1.get_center())
-        hand2 = Line(ORIGIN, UP * 0.6, color=WHITE, stroke_width=4).move_to(clock2.get_center())
-        
-        self.play(Create(hand1), Create(hand2))
-        
-        # Animate time difference
-        for i in range(5):
-            self.play(
-                Rotate(hand1, PI/2, about_point=clock1.get_center()),
-                Rotate(hand2, PI/6, about_point=clock2.get_center()),  # Much slower
-                run_time=1.2
-            )
+        # Animate time difference: the moving clock runs slower by gamma
+        self.play(time.animate.increment_value(15), run_time=6, rate_func=linear)
         
         # Add explanation
         explanation = Text("Moving clocks run slower!", font_size=24, color=YELLOW, weight=BOLD)
         explanation.shift(UP * 2.5)
         self.play(Write(explanation))
         
-        self.wait(6)
+        self.timer.wait_for_narration()
         self.clear()
 
     def energy_mass_with_subtitles(self):
@@ -206,7 +183,8 @@ class RelativityWithSubtitles(Scene):
         # Energy visualization
         energy = Circle(radius=2.5, color=YELLOW, fill_opacity=0.3, stroke_width=3).shift(RIGHT * 3)
         energy_inner = Circle(radius=1.8, color=GOLD, fill_opacity=0.5).shift(RIGHT * 3)
-        energy_label = Text("90 Trillion\nJoules!", font_size=20, color=YELLOW, weight=BOLD)
+        gram_energy = rest_energy(1e-3) / 1e12  # trillion joules
+        energy_label = Text(f"{gram_energy:.0f} Trillion\nJoules!", font_size=20, color=YELLOW, weight=BOLD)
         energy_label.move_to(energy.get_center())
         
         # Animate the demonstration
@@ -221,7 +199,7 @@ class RelativityWithSubtitles(Scene):
         example.shift(DOWN * 3)
         self.play(Write(example))
         
-        self.wait(6)
+        self.timer.wait_for_narration()
         self.clear()
 
     def conclusion_with_subtitles(self):
@@ -267,7 +245,7 @@ class RelativityWithSubtitles(Scene):
         quote_group.shift(DOWN * 3.5)
         
         self.play(Write(quote_group))
-        self.wait(8)
+        self.timer.wait_for_narration()
 
 
 # Version with advanced subtitle features
@@ -337,7 +315,7 @@ if __name__ == "__main__":
     print("   • Multiple subtitle styles")
     print("   • Enhanced readability")
     print("\n📋 Requirements:")
-    print("   pip install edge-tts")
+    print("   pip install edge-tts   (or RELATIVITY_TTS_BACKEND=pyttsx3 offline)")
     print("\n🎯 Commands:")
     print("   python -m manim -pql relativity_subtitles.py RelativityWithSubtitles")
     print("   python -m manim -pql relativity_subtitles.py RelativityAdvancedSubtitles")
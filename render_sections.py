@@ -0,0 +1,135 @@
+"""
+Section-Parallel Rendering for Relativity Videos
+Renders each segment of a sectioned scene (one that defines `sections` and
+`play_section`) as its own scene job in a process pool, then joins the clips
+with ffmpeg stream copy. A full render takes about as long as the slowest
+segment instead of the sum of all of them. Unchanged sections are reused from
+the section cache (see section_cache.py)
+
+Usage:
+    python render_sections.py relativity_explainer_enhanced EnhancedRelativityExplainer -q h
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_seed import SEED_ENV_VAR
+from section_cache import SectionCache, report, section_key
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def section_scene(scene_class, name):
+    """Subclass of scene_class whose construct plays a single section"""
+    def construct(self):
+        self.play_section(name)
+
+    return type(f"{scene_class.__name__}_{name}", (scene_class,), {"construct": construct})
+
+
+def render_section(module_name, class_name, name, quality="low_quality", media_dir="media",
+                   use_cache=True):
+    """Render one section in this process, or reuse its cached clip"""
+    from manim import config, tempconfig
+
+    sys.path.insert(0, os.getcwd())
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    cache = SectionCache(Path(media_dir) / "section_cache")
+    start = time.perf_counter()
+    with tempconfig({"quality": quality, "media_dir": media_dir, "preview": False}):
+        scene = section_scene(scene_class, name)()
+        key = section_key(scene_class, scene, name, config)
+        cached = cache.lookup(class_name, name, key, config.movie_file_extension)
+        if use_cache and cached:
+            return {"section": name, "movie": str(cached), "hit": True, "seconds": 0.0}
+
+        scene.render()
+        # Scenes that premix narration (narration_mixer.py) mux it into a separate file
+        recorder = getattr(scene, "cues", None)
+        movie = getattr(recorder, "output", None) or scene.renderer.file_writer.movie_file_path
+        if use_cache:
+            movie = cache.store(class_name, name, key, movie)
+    return {"section": name, "movie": str(movie), "hit": False,
+            "seconds": time.perf_counter() - start}
+
+
+def concat_videos(paths, output_path):
+    """Join clips that share codec settings without re-encoding them"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    list_path = output_path.with_suffix(".concat.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in paths:
+            f.write(f"file '{Path(path).resolve().as_posix()}'\n")
+    subprocess.run([
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", str(list_path),
+        "-c", "copy", str(output_path),
+    ], check=True)
+    list_path.unlink()
+    return output_path
+
+
+def render_parallel(module_name, class_name, quality="low_quality", media_dir="media",
+                    workers=None, output_path=None, sections=None, use_cache=True):
+    """Render every section of module_name.class_name in parallel and concatenate"""
+    scene_class = getattr(importlib.import_module(module_name), class_name)
+    sections = sections or list(scene_class.sections)
+    workers = workers or min(len(sections), os.cpu_count() or 1)
+    output_path = output_path or Path(media_dir) / "sections" / f"{class_name}.mp4"
+
+    print(f"🎬 Rendering {len(sections)} section(s) of {class_name} on {workers} worker(s)")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(render_section, module_name, class_name, name, quality,
+                               media_dir, use_cache)
+                   for name in sections]
+        results = [future.result() for future in futures]
+    wall_time = time.perf_counter() - start
+
+    report(results)
+    rendered = [r["seconds"] for r in results if not r["hit"]]
+    if rendered:
+        print(f"⏱️ {wall_time:.1f}s wall-clock, slowest section {max(rendered):.1f}s, "
+              f"{sum(rendered):.1f}s if rendered one after another")
+
+    output = concat_videos([r["movie"] for r in results], output_path)
+    print(f"✅ Joined video: {output}")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the sections of a scene in parallel")
+    parser.add_argument("module", help="module with the scene, e.g. relativity_explainer_enhanced")
+    parser.add_argument("scene", help="scene class that defines `sections`")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-j", "--workers", type=int, help="process count (default: cores)")
+    parser.add_argument("-o", "--output", help="joined video path")
+    parser.add_argument("--media-dir", default="media")
+    parser.add_argument("--sections", nargs="+", help="render only these sections")
+    parser.add_argument("--no-cache", action="store_true", help="re-render every section")
+    parser.add_argument("--seed", type=int, help="random seed for starfields etc. (default: 1905)")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        os.environ[SEED_ENV_VAR] = str(args.seed)  # Inherited by the worker processes
+
+    module = args.module[:-3] if args.module.endswith(".py") else args.module
+    render_parallel(module, args.scene, QUALITIES[args.quality], args.media_dir,
+                    args.workers, args.output, args.sections, not args.no_cache)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Deterministic Randomness for Relativity Videos
+Every random choice (star positions, sizes, twinkle phases) draws from a
+generator seeded per section. Repeated renders are then bit-identical, and
+hash-based caches (Manim's partial movies, section_cache.py) actually hit
+
+Change the sky with:
+    RELATIVITY_SEED=42 manim -pql relativity_explainer_enhanced.py EnhancedRelativityExplainer
+    python render_sections.py ... --seed 42
+    python simple_relativity_demo.py --seed 42
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+SEED_ENV_VAR = "RELATIVITY_SEED"
+DEFAULT_SEED = 1905  # Einstein's miracle year
+
+
+def get_seed(seed=None):
+    """Explicit seed, else RELATIVITY_SEED, else DEFAULT_SEED"""
+    if seed is not None:
+        return int(seed)
+    return int(os.environ.get(SEED_ENV_VAR, DEFAULT_SEED))
+
+
+def section_rng(section, seed=None):
+    """
+    Generator for one section. The stream depends only on the seed and the
+    section name, so a section draws the same stars whether it is rendered
+    alone, in a worker process or as part of the full scene.
+    """
+    digest = hashlib.sha256(f"{get_seed(seed)}:{section}".encode("utf-8")).digest()
+    return np.random.default_rng(int.from_bytes(digest[:8], "little"))
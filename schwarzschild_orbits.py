@@ -0,0 +1,129 @@
+"""
+Schwarzschild Geodesic Orbits for Relativity Videos
+Integrates the exact orbit equation of a test mass around a non-rotating
+star or black hole (including perihelion precession) with SciPy, samples it
+evenly in proper time and stores the samples as .npy files keyed by the
+orbit parameters. Later renders memory-map the file instead of integrating
+again, so a many-revolution orbit costs nothing after the first build
+
+Usage inside a scene:
+    orbit = GeodesicOrbit(periapsis=10, apoapsis=24, revolutions=3, size=2.5)
+    planet = Dot().move_to(orbit.start())
+    self.play(Create(orbit.path(color=GREEN)))
+    self.play(orbit.move(planet), run_time=6)   # faster near periapsis
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from manim import ORIGIN, UpdateFromAlphaFunc, VMobject, rate_functions
+import numpy as np
+from scipy.integrate import solve_ivp
+
+DEFAULT_CACHE_DIR = Path("media") / "orbit_cache"
+ORBIT_VERSION = 1  # Bump when the integration changes so old samples are not reused
+
+
+def angular_momentum_squared(periapsis, apoapsis):
+    """
+    L^2 (geometric units, G = M = 1) of the bound orbit with these turning
+    points, from equating the effective potential at both of them
+    """
+    up, ua = 1.0 / periapsis, 1.0 / apoapsis
+    denominator = (ua + up) - 2.0 * (ua * ua + ua * up + up * up)
+    if denominator <= 0:
+        raise ValueError(f"No stable orbit between r = {periapsis}M and r = {apoapsis}M")
+    return 2.0 / denominator
+
+
+def integrate_orbit(periapsis, apoapsis, revolutions=3, samples_per_revolution=720):
+    """
+    Solve u'' + u = M/L^2 + 3 M u^2 (u = 1/r, ' = d/dphi) from periapsis,
+    together with dtau/dphi = r^2 / L, and resample evenly in proper time.
+    Returns (N, 3) positions in units of M with z = 0.
+    """
+    L2 = angular_momentum_squared(periapsis, apoapsis)
+    L = np.sqrt(L2)
+
+    def rhs(phi, y):
+        u, du, _ = y
+        return [du, -u + 1.0 / L2 + 3.0 * u * u, 1.0 / (L * u * u)]
+
+    phi_end = 2 * np.pi * revolutions
+    solution = solve_ivp(rhs, (0.0, phi_end), [1.0 / periapsis, 0.0, 0.0], method="DOP853",
+                         rtol=1e-10, atol=1e-12, dense_output=True)
+    if not solution.success:
+        raise RuntimeError(f"Orbit integration failed: {solution.message}")
+
+    # Dense in angle, then interpolate to equal steps of proper time
+    phi = np.linspace(0.0, phi_end, 8 * samples_per_revolution * revolutions)
+    u, _, tau = solution.sol(phi)
+    tau_even = np.linspace(0.0, tau[-1], samples_per_revolution * revolutions)
+    phi_even = np.interp(tau_even, tau, phi)
+    r_even = 1.0 / np.interp(tau_even, tau, u)
+    return np.column_stack([r_even * np.cos(phi_even), r_even * np.sin(phi_even),
+                            np.zeros_like(r_even)])
+
+
+def orbit_key(periapsis, apoapsis, revolutions, samples_per_revolution):
+    payload = json.dumps({
+        "periapsis": float(periapsis),
+        "apoapsis": float(apoapsis),
+        "revolutions": revolutions,
+        "samples_per_revolution": samples_per_revolution,
+        "version": ORBIT_VERSION,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def schwarzschild_orbit(periapsis=10.0, apoapsis=24.0, revolutions=3, samples_per_revolution=720,
+                        cache_dir=DEFAULT_CACHE_DIR):
+    """Memory-mapped (N, 3) orbit samples, integrating and caching them on first use"""
+    cache_dir = Path(cache_dir)
+    key = orbit_key(periapsis, apoapsis, revolutions, samples_per_revolution)
+    path = cache_dir / f"orbit-{key[:16]}.npy"
+    if not path.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        samples = integrate_orbit(periapsis, apoapsis, revolutions, samples_per_revolution)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npy")
+        np.save(tmp, samples)
+        os.replace(tmp, path)  # Parallel section workers may build the same orbit
+    return np.load(path, mmap_mode="r")
+
+
+class GeodesicOrbit:
+    def __init__(self, periapsis=10.0, apoapsis=24.0, revolutions=3, size=2.5, center=ORIGIN,
+                 samples_per_revolution=720):
+        """
+        periapsis, apoapsis: turning points in units of the central mass M
+                             (stable orbits need periapsis above about 6M)
+        size: scene units at apoapsis
+        """
+        self.samples = schwarzschild_orbit(periapsis, apoapsis, revolutions,
+                                           samples_per_revolution)
+        self.scale = size / apoapsis
+        self.center = np.asarray(center, dtype=float)
+
+    def points(self):
+        return self.samples * self.scale + self.center
+
+    def start(self):
+        return self.samples[0] * self.scale + self.center
+
+    def position_at(self, alpha):
+        """Scene position after a fraction alpha of the orbit's proper time"""
+        f = np.clip(alpha, 0, 1) * (len(self.samples) - 1)
+        i = min(int(f), len(self.samples) - 2)
+        point = self.samples[i] + (f - i) * (self.samples[i + 1] - self.samples[i])
+        return point * self.scale + self.center
+
+    def path(self, **kwargs):
+        """The whole trajectory as one polyline"""
+        return VMobject(**kwargs).set_points_as_corners(self.points())
+
+    def move(self, mobject, **kwargs):
+        """Animation that carries mobject along the orbit at its physical pace"""
+        kwargs.setdefault("rate_func", rate_functions.linear)
+        return UpdateFromAlphaFunc(mobject, lambda m, a: m.move_to(self.position_at(a)), **kwargs)
@@ -0,0 +1,156 @@
+"""
+Per-Section Render Cache for Relativity Videos
+Keys each finished section clip on the source of the section method (and the
+scene methods it calls), the project modules the scene imports (starfield.py,
+relativity_physics.py, ...), its assets and the render config. After editing
+only twin_paradox, a rebuild re-renders that one section and reuses the rest
+byte-for-byte; editing a shared helper module re-renders every section
+"""
+
+import hashlib
+import inspect
+import json
+import re
+import shutil
+import sys
+import types
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path("media") / "section_cache"
+
+
+def section_source(scene_class, name):
+    """
+    Source of the section method plus every method of the scene's own module
+    it reaches through self.<name>, so editing a shared helper invalidates
+    exactly the sections that use it
+    """
+    seen = set()
+    stack = [name, "setup", "play_section"]
+    parts = []
+    while stack:
+        attr = stack.pop()
+        if attr in seen:
+            continue
+        seen.add(attr)
+        fn = getattr(scene_class, attr, None)
+        if not inspect.isfunction(fn) or fn.__module__ != scene_class.__module__:
+            continue  # Manim's methods don't change; project modules are hashed by helper_source_hash
+        source = inspect.getsource(fn)
+        parts.append(f"# {attr}\n{source}")
+        stack.extend(re.findall(r"self\.(\w+)", source))
+    return "\n".join(sorted(parts))
+
+
+def project_modules(module, root=None):
+    """
+    Modules under root (default: the module's own directory) that module
+    imports, directly or through other project modules. Installed packages
+    are skipped even when a virtualenv lives inside the project
+    """
+    root = Path(root or Path(module.__file__).parent).resolve()
+
+    def is_project(mod):
+        path = getattr(mod, "__file__", None)
+        if path is None:
+            return False
+        path = Path(path).resolve()
+        return root in path.parents and "site-packages" not in path.parts
+
+    found = {}
+    stack = [module]
+    while stack:
+        current = stack.pop()
+        for value in list(vars(current).values()):
+            if isinstance(value, types.ModuleType):
+                imported = value
+            else:
+                imported = sys.modules.get(getattr(value, "__module__", None) or "")
+            if (imported is None or imported is module or imported.__name__ in found
+                    or not is_project(imported)):
+                continue
+            found[imported.__name__] = imported
+            stack.append(imported)
+    return [found[name] for name in sorted(found)]
+
+
+def helper_source_hash(scene_class):
+    """
+    Hash of every project module the scene's module imports. The scene module
+    itself is left out: its methods are hashed per section by section_source
+    """
+    digest = hashlib.sha256()
+    for mod in project_modules(sys.modules[scene_class.__module__]):
+        digest.update(f"# {mod.__name__}\n".encode("utf-8"))
+        digest.update(Path(mod.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def hash_asset(asset):
+    """Files hash by content; anything else (voice names, settings) by value"""
+    path = Path(asset) if isinstance(asset, Path) else None
+    if path is not None and path.is_file():
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    return repr(asset)
+
+
+def render_settings(config):
+    """The parts of Manim's config that change the pixels of a section"""
+    return {
+        "pixel_width": config.pixel_width,
+        "pixel_height": config.pixel_height,
+        "frame_rate": config.frame_rate,
+        "background_color": str(config.background_color),
+        "movie_file_extension": config.movie_file_extension,
+    }
+
+
+def section_key(scene_class, scene, name, config):
+    """Cache key for one section of scene_class, given an instance for its assets"""
+    import manim
+
+    from render_seed import get_seed
+
+    assets = scene.section_assets(name) if hasattr(scene, "section_assets") else []
+    payload = json.dumps({
+        "scene": scene_class.__name__,
+        "section": name,
+        "source": hashlib.sha256(section_source(scene_class, name).encode("utf-8")).hexdigest(),
+        "helpers": helper_source_hash(scene_class),
+        "assets": [hash_asset(asset) for asset in assets],
+        "config": render_settings(config),
+        "seed": get_seed(),
+        "manim": manim.__version__,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SectionCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def clip_path(self, scene_name, name, key, suffix=".mp4"):
+        return self.cache_dir / scene_name / f"{name}-{key[:16]}{suffix}"
+
+    def lookup(self, scene_name, name, key, suffix=".mp4"):
+        path = self.clip_path(scene_name, name, key, suffix)
+        return path if path.exists() else None
+
+    def store(self, scene_name, name, key, movie_path):
+        """Copy a freshly rendered clip in and drop older clips of the section"""
+        movie_path = Path(movie_path)
+        path = self.clip_path(scene_name, name, key, movie_path.suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for stale in path.parent.glob(f"{name}-*{movie_path.suffix}"):
+            stale.unlink()
+        shutil.copyfile(movie_path, path)
+        return path
+
+
+def report(results):
+    """Print which sections were reused and which were re-rendered"""
+    hits = [r for r in results if r["hit"]]
+    print(f"📦 Section cache: {len(hits)} hit(s), {len(results) - len(hits)} miss(es)")
+    for r in results:
+        status = "reused" if r["hit"] else f"rendered in {r['seconds']:.1f}s"
+        print(f"   {'✅' if r['hit'] else '🎬'} {r['section']}: {status}")
@@ -4,37 +4,244 @@ A basic demonstration of relativity concepts using matplotlib animations
 
 This version can run immediately without installing Manim.
 For full-featured videos, use the Manim versions.
+
+Each section draws its static layer (text, frames, formulas) once and
+returns a frame count plus an update function that only moves its animated
+artists. Sections play through FuncAnimation with blitting at a target frame
+rate, so a frame redraws just the clock hands, the planet and the FPS readout.
+Stars, motion lines and the warped spacetime mesh are each one collection
+artist, so their resolution (class attributes) costs array size, not artists.
+
+--export renders headless on the Agg backend instead: the same sections are
+blitted offscreen and every frame goes straight to ffmpeg (MP4) or Pillow
+(GIF) with no waiting, many times faster than real time.
+
+Usage:
+    python simple_relativity_demo.py --fps 30
+    python simple_relativity_demo.py --export relativity_demo.mp4   # or .gif
+    python simple_relativity_demo.py --widget                       # velocity slider
 """
 
+from collections import deque
+from pathlib import Path
+import shutil
+import subprocess
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Circle, Rectangle
+from matplotlib.widgets import Slider
+from PIL import Image
+import argparse
 import time
+from relativity_calculator import relativity_table
+from relativity_physics import gamma, length_contraction, proper_time, rest_energy
+from render_seed import section_rng
 
 class SimpleRelativityDemo:
-    def __init__(self):
+    sections = ["title_screen", "time_dilation_demo", "length_contraction_demo",
+                "energy_mass_demo", "spacetime_curvature_demo", "conclusion"]
+    
+    # Resolution of the batched layers; each layer is one artist at any size
+    title_stars = 20
+    conclusion_stars = 30
+    grid_spacing = 1.0           # Spacetime grid line spacing
+    grid_samples_per_unit = 8    # Vertices per unit along each grid line
+
+    def __init__(self, seed=None, fps=30):
+        self.seed = seed  # None = RELATIVITY_SEED or the project default
+        self.fps = fps
         self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self.fig.set_facecolor('black')
         self.ax.set_xlim(-10, 10)
         self.ax.set_ylim(-6, 6)
         self.ax.set_aspect('equal')
         self.ax.set_facecolor('black')
+        self.ax.axis('off')
+        
+        # Persistent across sections; only their text changes
+        self.title = self.ax.set_title("", color='white', fontsize=16)
+        self.fps_text = self.ax.text(9.8, -5.8, "", color='gray', fontsize=9, ha='right')
+        self.frame_times = deque(maxlen=self.fps)
+        self.animation = None
         
     def run_demo(self):
         """Run the complete demonstration"""
-        self.title_screen()
-        self.time_dilation_demo()
-        self.length_contraction_demo()
-        self.energy_mass_demo()
-        self.spacetime_curvature_demo()
-        self.conclusion()
+        if plt.get_backend().lower() == "agg":
+            path = "relativity_demo.mp4" if shutil.which("ffmpeg") else "relativity_demo.gif"
+            print(f"🖥️ No display available, exporting to {path} instead")
+            self.export(path)
+            return
+        plt.show(block=False)
+        for name in self.sections:
+            if not self.play(getattr(self, name)):
+                break
+    
+    def render_frames(self, dpi=100):
+        """
+        Yield every frame of the demo as an (H, W, 4) RGBA view of the canvas,
+        valid until the next frame. Offscreen blitting: each section's static
+        layer is drawn once and a frame only redraws its moving artists.
+        """
+        self.fig.set_dpi(dpi)
+        canvas = self.fig.canvas
+        self.fps_text.set_visible(False)  # Render speed means nothing in a video
+        try:
+            for name in self.sections:
+                n_frames, update = getattr(self, name)()
+                for artist in update(0):
+                    artist.set_animated(True)  # Left out of the full draw below
+                canvas.draw()
+                background = canvas.copy_from_bbox(self.fig.bbox)
+                for frame in range(n_frames):
+                    moving = update(frame)
+                    canvas.restore_region(background)
+                    for artist in moving:
+                        self.ax.draw_artist(artist)
+                    yield np.asarray(canvas.buffer_rgba())
+        finally:
+            self.fps_text.set_visible(True)
+    
+    def export(self, path, dpi=100):
+        """
+        Render the whole demo headless to a video file, as fast as frames draw:
+        .gif through Pillow, anything else (.mp4, .webm, ...) through ffmpeg
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        if path.suffix.lower() == ".gif":
+            n_frames = self.export_gif(path, dpi)
+        else:
+            n_frames = self.export_ffmpeg(path, dpi)
+        elapsed = time.perf_counter() - start
+        print(f"🎬 Exported {n_frames / self.fps:.1f}s of video ({n_frames} frames) to {path} "
+              f"in {elapsed:.1f}s ({n_frames / elapsed:.0f} frames/s)")
+        return path
+    
+    def export_ffmpeg(self, path, dpi):
+        """Pipe raw RGBA frames into ffmpeg"""
+        if not shutil.which("ffmpeg"):
+            raise RuntimeError("ffmpeg not found; install it or export a .gif instead")
+        ffmpeg = None
+        n_frames = 0
+        try:
+            for frame in self.render_frames(dpi):
+                if ffmpeg is None:
+                    height, width = frame.shape[:2]
+                    ffmpeg = subprocess.Popen([
+                        "ffmpeg", "-y", "-loglevel", "error",
+                        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+                        "-r", str(self.fps), "-i", "-",
+                        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",  # yuv420p needs even sizes
+                        "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path),
+                    ], stdin=subprocess.PIPE)
+                ffmpeg.stdin.write(frame.data)
+                n_frames += 1
+        finally:
+            if ffmpeg is not None:
+                ffmpeg.stdin.close()
+                if ffmpeg.wait():
+                    raise RuntimeError(f"ffmpeg failed writing {path}")
+        return n_frames
+    
+    def export_gif(self, path, dpi):
+        """
+        Write an animated GIF with Pillow. Runs of identical frames (the
+        sections with no moving parts) become one frame with a longer duration.
+        """
+        images, durations = [], []
+        previous = None
+        n_frames = 0
+        for frame in self.render_frames(dpi):
+            n_frames += 1
+            if previous is not None and np.array_equal(frame, previous):
+                durations[-1] += 1000 / self.fps
+                continue
+            previous = frame.copy()
+            images.append(Image.fromarray(previous[..., :3]).quantize(method=Image.Quantize.FASTOCTREE))
+            durations.append(1000 / self.fps)
+        images[0].save(path, save_all=True, append_images=images[1:],
+                       duration=[round(d) for d in durations], loop=0)
+        return n_frames
+    
+    def frames(self, seconds):
+        """Number of frames for seconds at the target frame rate"""
+        return max(1, int(round(seconds * self.fps)))
+    
+    def begin_section(self, title):
+        """Remove the previous section's artists; limits, title and FPS readout persist"""
+        for artist in [*self.ax.texts, *self.ax.lines, *self.ax.patches, *self.ax.collections]:
+            if artist is not self.fps_text:
+                artist.remove()
+        self.title.set_text(title)
+    
+    def starfield(self, section, n_stars, markersize, alpha=1.0):
+        """n_stars seeded stars as a single scatter artist"""
+        rng = section_rng(section, self.seed)
+        stars = rng.uniform([-10, -6], [10, 6], (n_stars, 2))
+        return self.ax.scatter(stars[:, 0], stars[:, 1], s=markersize ** 2, marker='*',
+                               color='white', alpha=alpha, linewidths=0)
+    
+    def hold(self, seconds):
+        """Frame count and update for a section with no moving parts"""
+        return self.frames(seconds), lambda frame: []
+    
+    def tick_fps(self):
+        """Update the FPS readout from the last second of frame timestamps"""
+        self.frame_times.append(time.perf_counter())
+        if len(self.frame_times) > 1:
+            fps = (len(self.frame_times) - 1) / (self.frame_times[-1] - self.frame_times[0])
+            self.fps_text.set_text(f"{fps:.0f} fps (target {self.fps})")
+        return self.fps_text
+    
+    def animate(self, update, n_frames=None):
+        """
+        Start a blitted FuncAnimation of update's artists plus the FPS readout
+        (n_frames=None runs until the window closes). The moving artists are
+        marked animated before the first full draw, so the cached background
+        never holds a stale copy of them.
+        """
+        for artist in [*update(0), self.fps_text]:
+            artist.set_animated(True)
+        self.frame_times.clear()
+        self.animation = animation.FuncAnimation(
+            self.fig, lambda frame: [*update(frame), self.tick_fps()], frames=n_frames,
+            interval=1000 / self.fps, blit=True, repeat=False, cache_frame_data=False)
+        self.fig.canvas.draw_idle()  # One full draw of the static layer starts the animation
+        return self.animation
+    
+    def run_widget(self, velocity=0.8):
+        """Show the slider calculator until the window is closed"""
+        if plt.get_backend().lower() == "agg":
+            print("🖥️ The slider calculator needs a display")
+            return
+        self.animate(self.calculator_widget(velocity))
+        plt.show()
+    
+    def play(self, section):
+        """
+        Build a section, then blit its moving artists until its frames run out.
+        Returns False once the window has been closed.
+        """
+        n_frames, update = section()
+        self.animate(update, n_frames)
+        
+        # Run the GUI event loop without redrawing; give slow machines some slack
+        deadline = time.perf_counter() + 2 * n_frames / self.fps + 1
+        while self.animation.event_source is not None and time.perf_counter() < deadline:
+            if not plt.fignum_exists(self.fig.number):
+                return False
+            self.fig.canvas.start_event_loop(0.05)
+        if self.animation.event_source is not None:
+            self.animation.pause()
+        return plt.fignum_exists(self.fig.number)
         
     def title_screen(self):
         """Display title screen"""
-        self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-6, 6)
-        self.ax.set_facecolor('black')
+        self.begin_section("Simple Relativity Demonstration")
         
         # Title
         self.ax.text(0, 2, "Einstein's Theory of Relativity", 
@@ -51,21 +258,13 @@ class SimpleRelativityDemo:
         self.ax.add_patch(circle)
         
         # Stars
-        for _ in range(20):
-            x, y = np.random.uniform(-10, 10), np.random.uniform(-6, 6)
-            self.ax.plot(x, y, '*', color='white', markersize=3)
+        self.starfield("title_screen", self.title_stars, markersize=3)
         
-        self.ax.axis('off')
-        plt.title("Simple Relativity Demonstration", color='white', fontsize=16)
-        plt.show(block=False)
-        plt.pause(3)
+        return self.hold(3)
         
     def time_dilation_demo(self):
         """Demonstrate time dilation with animated clocks"""
-        self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-6, 6)
-        self.ax.set_facecolor('black')
+        self.begin_section("Time Dilation Demo")
         
         self.ax.text(0, 5, "Time Dilation", fontsize=18, color='red', ha='center', weight='bold')
         self.ax.text(0, 4, "Moving clocks run slower", fontsize=14, color='white', ha='center')
@@ -86,48 +285,35 @@ class SimpleRelativityDemo:
         self.ax.add_patch(stat_clock)
         self.ax.add_patch(mov_clock)
         
-        # Animate clock hands
-        stat_hand_line = None
-        mov_hand_line = None
+        # Time dilation formula
+        self.ax.text(0, -1, "Δt' = γΔt", fontsize=16, color='yellow', ha='center', weight='bold')
+        self.ax.text(0, -2, "γ = 1/√(1 - v²/c²)", fontsize=12, color='yellow', ha='center')
+        self.ax.text(0, -3, f"For v = 0.8c: γ = {gamma(0.8):.2f}", 
+                    fontsize=12, color='yellow', ha='center')
         
-        for i in range(20):
-            # Clear previous hands
-            if stat_hand_line is not None:
-                stat_hand_line.remove()
-            if mov_hand_line is not None:
-                mov_hand_line.remove()
-            
-            # Stationary clock hand (faster)
-            stat_angle = i * np.pi / 5
-            stat_x = -6.5 + 0.6 * np.cos(stat_angle - np.pi/2)
-            stat_y = 2 + 0.6 * np.sin(stat_angle - np.pi/2)
-            stat_hand_line = self.ax.plot([-6.5, stat_x], [2, stat_y], color='cyan', linewidth=3)[0]
-            
-            # Moving clock hand (slower due to time dilation)
-            mov_angle = i * np.pi / 8  # Slower
-            mov_x = 6.5 + 0.6 * np.cos(mov_angle - np.pi/2)
-            mov_y = 2 + 0.6 * np.sin(mov_angle - np.pi/2)
-            mov_hand_line = self.ax.plot([6.5, mov_x], [2, mov_y], color='orange', linewidth=3)[0]
-            
-            # Time dilation formula
-            self.ax.text(0, -1, "Δt' = γΔt", fontsize=16, color='yellow', ha='center', weight='bold')
-            self.ax.text(0, -2, "γ = 1/√(1 - v²/c²)", fontsize=12, color='yellow', ha='center')
-            self.ax.text(0, -3, f"For v = 0.8c: γ = {1/np.sqrt(1-0.8**2):.2f}", 
-                        fontsize=12, color='yellow', ha='center')
-            
-            self.ax.axis('off')
-            plt.title("Time Dilation Demo", color='white', fontsize=16)
-            plt.draw()
-            plt.pause(0.3)
+        # Clock hands, the only moving parts
+        stat_hand = self.ax.plot([], [], color='cyan', linewidth=3)[0]
+        mov_hand = self.ax.plot([], [], color='orange', linewidth=3)[0]
+        
+        # Hand angles for every frame: 6 s at a third of a turn per second, then a 2 s hold
+        n_frames = self.frames(8)
+        stat_angle = np.minimum(np.arange(n_frames) / self.fps, 6) * 2 * np.pi / 3
+        mov_angle = proper_time(stat_angle, 0.8)  # Slower by gamma
+        stat_x = -6.5 + 0.6 * np.cos(stat_angle - np.pi/2)
+        stat_y = 2 + 0.6 * np.sin(stat_angle - np.pi/2)
+        mov_x = 6.5 + 0.6 * np.cos(mov_angle - np.pi/2)
+        mov_y = 2 + 0.6 * np.sin(mov_angle - np.pi/2)
+        
+        def update(frame):
+            stat_hand.set_data([-6.5, stat_x[frame]], [2, stat_y[frame]])
+            mov_hand.set_data([6.5, mov_x[frame]], [2, mov_y[frame]])
+            return [stat_hand, mov_hand]
         
-        plt.pause(2)
+        return n_frames, update
         
     def length_contraction_demo(self):
         """Demonstrate length contraction"""
-        self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-6, 6)
-        self.ax.set_facecolor('black')
+        self.begin_section("Length Contraction Demo")
         
         self.ax.text(0, 5, "Length Contraction", fontsize=18, color='green', ha='center', weight='bold')
         self.ax.text(0, 4, "Moving objects appear shorter", fontsize=14, color='white', ha='center')
@@ -138,8 +324,7 @@ class SimpleRelativityDemo:
         self.ax.text(0, 3, "Ruler at Rest: L₀ = 8 units", color='blue', ha='center', fontsize=12)
         
         # Contracted ruler (moving)
-        gamma = 1/np.sqrt(1-0.8**2)
-        contracted_length = 8 / gamma
+        contracted_length = length_contraction(8, 0.8)
         contracted_ruler = Rectangle((-contracted_length/2, 0), contracted_length, 0.5, 
                                    fill=True, color='red', alpha=0.7)
         self.ax.add_patch(contracted_ruler)
@@ -147,26 +332,22 @@ class SimpleRelativityDemo:
                     color='red', ha='center', fontsize=12)
         
         # Motion lines
-        for x in np.linspace(-3, 3, 10):
-            self.ax.plot([x-0.5, x+0.5], [-0.5, -0.5], color='yellow', linewidth=1, alpha=0.7)
+        x = np.linspace(-3, 3, 10)
+        y = np.full_like(x, -0.5)
+        motion_lines = np.stack([x-0.5, y, x+0.5, y], axis=1).reshape(-1, 2, 2)
+        self.ax.add_collection(LineCollection(motion_lines, colors='yellow', linewidths=1, alpha=0.7))
         
         # Formula
         self.ax.text(0, -2, "L = L₀/γ = L₀√(1 - v²/c²)", 
                     fontsize=14, color='yellow', ha='center', weight='bold')
-        self.ax.text(0, -3, f"For v = 0.8c: L = L₀ × {1/gamma:.2f}", 
+        self.ax.text(0, -3, f"For v = 0.8c: L = L₀ × {length_contraction(1, 0.8):.2f}", 
                     fontsize=12, color='yellow', ha='center')
         
-        self.ax.axis('off')
-        plt.title("Length Contraction Demo", color='white', fontsize=16)
-        plt.draw()
-        plt.pause(3)
+        return self.hold(3)
         
     def energy_mass_demo(self):
         """Demonstrate E=mc²"""
-        self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-6, 6)
-        self.ax.set_facecolor('black')
+        self.begin_section("E = mc² Demonstration")
         
         self.ax.text(0, 5, "Mass-Energy Equivalence", fontsize=18, color='purple', ha='center', weight='bold')
         
@@ -188,40 +369,38 @@ class SimpleRelativityDemo:
         self.ax.text(0, 2, "E = mc²", fontsize=32, color='gold', ha='center', weight='bold')
         
         # Example calculation
-        self.ax.text(0, -4, "Example: 1 gram of matter = 90 trillion joules", 
+        self.ax.text(0, -4, f"Example: 1 gram of matter = {rest_energy(1e-3) / 1e12:.0f} trillion joules", 
                     color='cyan', ha='center', fontsize=10)
         self.ax.text(0, -4.5, "(Enough energy to power a city for hours!)", 
                     color='cyan', ha='center', fontsize=10, style='italic')
         
-        self.ax.axis('off')
-        plt.title("E = mc² Demonstration", color='white', fontsize=16)
-        plt.draw()
-        plt.pause(3)
+        return self.hold(3)
         
     def spacetime_curvature_demo(self):
         """Demonstrate spacetime curvature"""
-        self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-6, 6)
-        self.ax.set_facecolor('black')
+        self.begin_section("General Relativity: Spacetime Curvature")
         
         self.ax.text(0, 5, "Spacetime Curvature", fontsize=18, color='orange', ha='center', weight='bold')
         self.ax.text(0, 4, "Mass curves spacetime", fontsize=14, color='white', ha='center')
         
-        # Create grid
-        x = np.linspace(-8, 8, 17)
-        y = np.linspace(-4, 4, 9)
-        
-        # Draw curved grid around central mass
-        for i in range(len(x)):
-            for j in range(len(y)):
-                if np.sqrt(x[i]**2 + y[j]**2) > 1.5:  # Don't draw inside the mass
-                    # Apply curvature effect
-                    r = np.sqrt(x[i]**2 + y[j]**2)
-                    curvature = 0.5 / r if r > 0.1 else 0
-                    curved_y = y[j] - curvature
-                    
-                    self.ax.plot(x[i], curved_y, 'o', color='blue', markersize=2, alpha=0.6)
+        # Grid lines, all sampled with the same number of vertices so the
+        # whole mesh is one (lines, vertices, 2) array
+        spacing = self.grid_spacing
+        n = int(16 * self.grid_samples_per_unit) + 1
+        verticals = np.arange(-8, 8 + spacing/2, spacing)
+        horizontals = np.arange(-4, 4 + spacing/2, spacing)
+        along_y = np.linspace(-4, 4, n)
+        along_x = np.linspace(-8, 8, n)
+        mesh = np.concatenate([
+            np.stack(np.broadcast_arrays(verticals[:, None], along_y[None, :]), axis=-1),
+            np.stack(np.broadcast_arrays(along_x[None, :], horizontals[:, None]), axis=-1),
+        ])
+        
+        # Pull every vertex toward the central mass; softened so lines never cross
+        r2 = np.sum(mesh**2, axis=-1, keepdims=True)
+        warped = mesh * (1 - 1.2 / (r2 + 1.2**2))
+        self.ax.add_collection(LineCollection(warped, colors='blue', linewidths=1, alpha=0.6,
+                                              zorder=0.5))
         
         # Central mass (star)
         star = Circle((0, 0), 1, fill=True, color='yellow', alpha=0.9)
@@ -234,25 +413,25 @@ class SimpleRelativityDemo:
         orbit_y = 2 * np.sin(theta)
         self.ax.plot(orbit_x, orbit_y, '--', color='green', linewidth=2, alpha=0.7)
         
-        # Planet
-        planet = Circle((4, 0), 0.3, fill=True, color='blue', alpha=0.8)
-        self.ax.add_patch(planet)
-        
         # Einstein's field equation
         self.ax.text(0, -4, "Gμν = (8πG/c⁴)Tμν", fontsize=12, color='yellow', ha='center', weight='bold')
         self.ax.text(0, -4.5, "Einstein's Field Equation", color='yellow', ha='center', fontsize=10)
         
-        self.ax.axis('off')
-        plt.title("General Relativity: Spacetime Curvature", color='white', fontsize=16)
-        plt.draw()
-        plt.pause(3)
+        # Planet, the only moving part: one orbit over the section
+        planet = Circle((4, 0), 0.3, fill=True, color='blue', alpha=0.8)
+        self.ax.add_patch(planet)
+        n_frames = self.frames(3)
+        phase = np.linspace(0, 2*np.pi, n_frames)
+        
+        def update(frame):
+            planet.center = (4 * np.cos(phase[frame]), 2 * np.sin(phase[frame]))
+            return [planet]
+        
+        return n_frames, update
         
     def conclusion(self):
         """Display conclusion"""
-        self.ax.clear()
-        self.ax.set_xlim(-10, 10)
-        self.ax.set_ylim(-6, 6)
-        self.ax.set_facecolor('black')
+        self.begin_section("Thank you for watching!")
         
         self.ax.text(0, 4, "Einstein's Revolutionary Ideas", 
                     fontsize=18, color='green', ha='center', weight='bold')
@@ -274,16 +453,79 @@ class SimpleRelativityDemo:
                     fontsize=10, color='yellow', ha='center')
         
         # Add decorative elements
-        for _ in range(30):
-            x, y = np.random.uniform(-10, 10), np.random.uniform(-6, 6)
-            self.ax.plot(x, y, '*', color='white', markersize=2, alpha=0.5)
-        
-        self.ax.axis('off')
-        plt.title("Thank you for watching!", color='white', fontsize=16)
-        plt.draw()
-        plt.pause(5)
+        self.starfield("conclusion", self.conclusion_stars, markersize=2, alpha=0.5)
+        
+        return self.hold(5)
+        
+    def calculator_widget(self, velocity=0.8):
+        """
+        Live calculator on the existing figure: a velocity slider re-times the
+        ship clock and resizes the moving ruler and energy readouts by mutating
+        their artists. Returns the per-frame update for animate()
+        """
+        self.begin_section("Relativistic Calculator")
+        
+        self.ax.text(0, 5, "Drag the slider to change the ship's speed", fontsize=14,
+                    color='white', ha='center')
+        
+        # Clocks: Earth ticks one turn per 4 s, the ship clock at 1/γ of that
+        for x, label, color in [(-5, "Earth clock", 'blue'), (5, "Ship clock", 'red')]:
+            self.ax.add_patch(Circle((x, 2), 1.2, fill=False, color='white', linewidth=2))
+            self.ax.text(x, 3.6, label, color=color, ha='center', fontsize=12)
+        earth_hand = self.ax.plot([], [], color='cyan', linewidth=3)[0]
+        ship_hand = self.ax.plot([], [], color='orange', linewidth=3)[0]
+        ship_rate = self.ax.text(5, 0.3, "", color='orange', ha='center', fontsize=10)
+        
+        # Rulers: rest length 8, the moving one contracted to 8/γ
+        self.ax.plot([-4, 4], [-1, -1], color='blue', linewidth=12, alpha=0.7, solid_capstyle='butt')
+        self.ax.text(-4.3, -1, "At rest", color='blue', ha='right', va='center', fontsize=10)
+        moving_ruler = self.ax.plot([], [], color='red', linewidth=12, alpha=0.7,
+                                    solid_capstyle='butt')[0]
+        ruler_text = self.ax.text(0, -2.4, "", color='red', ha='center', fontsize=11)
+        
+        # Energy readouts for 1 kg
+        gamma_text = self.ax.text(0, -3.4, "", color='yellow', ha='center', fontsize=14,
+                                 weight='bold')
+        energy_text = self.ax.text(0, -4.6, "", color='cyan', ha='center', fontsize=11)
+        
+        slider_ax = self.fig.add_axes([0.25, 0.06, 0.5, 0.03], facecolor='#222222')
+        self.slider = Slider(slider_ax, "v / c", 0.0, 0.99, valinit=velocity, valfmt='%.3f', color='orange',
+                             handle_style={'size': 0})
+        self.slider.label.set_color('white')
+        self.slider.valtext.set_color('white')
+        self.slider.drawon = False  # The animation blits it instead of a full redraw per drag
+        
+        state = {"velocity": None, "frame": 0, "ship_angle": 0.0, "rate": 1.0}
+        
+        def hand(x, angle):
+            return [x, x + np.sin(angle)], [2, 2 + np.cos(angle)]
+        
+        def update(frame):
+            v = self.slider.val
+            if v != state["velocity"]:  # Text is only re-laid out when the speed changed
+                row = relativity_table(v, 1.0)
+                state["velocity"], state["rate"] = v, float(row['length_contraction'])
+                ship_rate.set_text(f"{state['rate']:.3f} s per Earth second")
+                moving_ruler.set_data([-4 * state['rate'], 4 * state['rate']], [-1.7, -1.7])
+                ruler_text.set_text(f"Moving ruler: L = L₀/γ = {8 * state['rate']:.2f} units")
+                gamma_text.set_text(f"v = {v:.3f}c    γ = {float(row['gamma']):.3f}")
+                energy_text.set_text(f"1 kg:  E₀ = {float(row['rest_energy']):.3e} J    "
+                                     f"E = {float(row['total_energy']):.3e} J    "
+                                     f"K = {float(row['kinetic_energy']):.3e} J")
+            
+            # The ship clock integrates its own rate, so speed changes keep its reading
+            turn = 2 * np.pi / (4 * self.fps)
+            state["ship_angle"] += (frame - state["frame"]) * turn * state["rate"]
+            state["frame"] = frame
+            earth_hand.set_data(*hand(-5, frame * turn))
+            ship_hand.set_data(*hand(5, state["ship_angle"]))
+            return [earth_hand, ship_hand, ship_rate, moving_ruler, ruler_text, gamma_text,
+                    energy_text, self.slider.poly, self.slider.valtext]
+        
+        return update
 
-def create_interactive_demo():
+
+def create_interactive_demo(seed=None, fps=30):
     """Create an interactive demonstration"""
     def relativistic_calculator():
         """Calculate relativistic effects for given velocity"""
@@ -297,24 +539,19 @@ def create_interactive_demo():
                 print("Velocity must be between 0 and 0.99c")
                 return
             
-            gamma = 1 / np.sqrt(1 - v_fraction**2)
+            row = relativity_table(v_fraction, 1.0)  # Same kernel as relativity_calculator.py batches
             
             print(f"\nFor velocity = {v_fraction:.2f}c:")
-            print(f"Lorentz factor (γ) = {gamma:.3f}")
-            print(f"Time dilation: Time runs {gamma:.2f}x slower")
-            print(f"Length contraction: Length is {1/gamma:.3f}x shorter")
-            print(f"Relativistic mass increase: {gamma:.2f}x rest mass")
+            print(f"Lorentz factor (γ) = {row['gamma']:.3f}")
+            print(f"Time dilation: Time runs {row['time_dilation']:.2f}x slower")
+            print(f"Length contraction: Length is {row['length_contraction']:.3f}x shorter")
+            print(f"Relativistic mass increase: {row['gamma']:.2f}x rest mass")
             
             # Energy calculation for 1 kg
-            c = 299792458  # m/s
-            rest_energy = c**2  # J (for 1 kg)
-            total_energy = gamma * rest_energy
-            kinetic_energy = total_energy - rest_energy
-            
             print(f"\nFor 1 kg object:")
-            print(f"Rest energy: {rest_energy:.2e} J")
-            print(f"Total energy: {total_energy:.2e} J")
-            print(f"Kinetic energy: {kinetic_energy:.2e} J")
+            print(f"Rest energy: {row['rest_energy']:.2e} J")
+            print(f"Total energy: {row['total_energy']:.2e} J")
+            print(f"Kinetic energy: {row['kinetic_energy']:.2e} J")
             
         except ValueError:
             print("Please enter a valid number")
@@ -325,25 +562,45 @@ def create_interactive_demo():
         print("="*50)
         print("1. Run visual demonstration")
         print("2. Relativistic calculator")
-        print("3. Exit")
+        print("3. Live calculator (velocity slider)")
+        print("4. Exit")
         
-        choice = input("\nEnter your choice (1-3): ")
+        choice = input("\nEnter your choice (1-4): ")
         
         if choice == '1':
-            demo = SimpleRelativityDemo()
+            demo = SimpleRelativityDemo(seed=seed, fps=fps)
             demo.run_demo()
         elif choice == '2':
             relativistic_calculator()
         elif choice == '3':
+            SimpleRelativityDemo(seed=seed, fps=fps).run_widget()
+        elif choice == '4':
             print("Thank you for exploring relativity!")
             break
         else:
-            print("Invalid choice. Please enter 1, 2, or 3.")
+            print("Invalid choice. Please enter 1, 2, 3, or 4.")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simple matplotlib relativity demo")
+    parser.add_argument("--seed", type=int, help="random seed for the starfields (default: 1905)")
+    parser.add_argument("--fps", type=int, default=30, help="target frame rate of the animations")
+    parser.add_argument("--export", metavar="FILE",
+                        help="render headless to FILE (.mp4 or .gif) instead of showing a window")
+    parser.add_argument("--dpi", type=int, default=100, help="export resolution (100 = 1200x800)")
+    parser.add_argument("--widget", action="store_true", help="open the velocity slider calculator")
+    args = parser.parse_args()
+    
+    if args.export:
+        plt.switch_backend("Agg")
+        SimpleRelativityDemo(seed=args.seed, fps=args.fps).export(args.export, dpi=args.dpi)
+        raise SystemExit
+    if args.widget:
+        SimpleRelativityDemo(seed=args.seed, fps=args.fps).run_widget()
+        raise SystemExit
+    
     print("Einstein's Theory of Relativity - Simple Demo")
     print("This is a basic version using matplotlib.")
     print("For professional-quality videos, install Manim and run the other scripts.")
     print("\nStarting interactive demonstration...")
     
-    create_interactive_demo()
+    create_interactive_demo(seed=args.seed, fps=args.fps)
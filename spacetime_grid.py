@@ -0,0 +1,102 @@
+"""
+Vectorized Warped Spacetime Grid for Relativity Videos
+The whole grid is one VMobject whose lines are subpaths of a single point
+array. Each frame, a displacement field from any number of (moving) point
+masses is applied to every vertex in one NumPy expression, so a dense grid
+costs one array update instead of a Python loop over Line mobjects
+
+Usage inside a scene:
+    grid = WarpedGrid(x_range=(-6, 6), y_range=(-3, 3), spacing=0.5)
+    grid.add_mass(ORIGIN, strength=1.0)
+    grid.add_mass(planet, strength=0.1)         # follows the planet every frame
+    self.play(Create(grid))
+    self.play(grid.warp_to(1), run_time=2)      # flat -> curved
+"""
+
+from manim import BLUE, Mobject, ValueTracker, VMobject, config
+import numpy as np
+
+
+def quality_samples_per_unit(base=8):
+    """Vertices per scene unit along each line, scaled with output resolution"""
+    return max(2, int(round(base * config.pixel_height / 480)))
+
+
+def point_mass_displacement(points, mass_positions, strengths, softening=0.3, max_pull=0.9):
+    """
+    Pull every point toward every mass, vectorized over both.
+
+    Each mass moves a point by strength / (r^2 + softening^2) of its distance
+    to the mass, capped at max_pull so no vertex is dragged past a mass.
+    points: (N, 3); mass_positions: (M, 3); strengths: (M,). Returns (N, 3).
+    """
+    if len(mass_positions) == 0:
+        return np.zeros_like(points)
+    diff = mass_positions[None, :, :2] - points[:, None, :2]          # (N, M, 2)
+    r2 = np.einsum("nmk,nmk->nm", diff, diff) + softening ** 2       # (N, M)
+    pull = np.minimum(strengths[None, :] / r2, max_pull)             # (N, M)
+    displacement = np.zeros_like(points)
+    displacement[:, :2] = np.einsum("nm,nmk->nk", pull, diff)
+    return displacement
+
+
+class WarpedGrid(VMobject):
+    def __init__(self, x_range=(-6, 6), y_range=(-3, 3), spacing=1.0, samples_per_unit=None,
+                 softening=0.3, color=BLUE, stroke_width=1, stroke_opacity=0.6, **kwargs):
+        super().__init__(color=color, stroke_width=stroke_width,
+                         stroke_opacity=stroke_opacity, **kwargs)
+        self.softening = softening
+        self.masses = []  # (position array or Mobject, strength)
+        self.warp = ValueTracker(0.0)  # 0 = flat, 1 = full curvature
+        samples_per_unit = samples_per_unit or quality_samples_per_unit()
+
+        # Every line is a polyline of samples; all samples live in one array
+        (x0, x1), (y0, y1) = x_range, y_range
+        lines = []
+        for x in np.arange(x0, x1 + spacing / 2, spacing):
+            ys = np.linspace(y0, y1, max(2, int((y1 - y0) * samples_per_unit) + 1))
+            lines.append(np.column_stack([np.full_like(ys, x), ys, np.zeros_like(ys)]))
+        for y in np.arange(y0, y1 + spacing / 2, spacing):
+            xs = np.linspace(x0, x1, max(2, int((x1 - x0) * samples_per_unit) + 1))
+            lines.append(np.column_stack([xs, np.full_like(xs, y), np.zeros_like(xs)]))
+        self.flat_vertices = np.concatenate(lines)
+
+        # Index pairs for each straight segment, never bridging two lines
+        starts = np.cumsum([0] + [len(line) for line in lines[:-1]])
+        self.segment_start = np.concatenate(
+            [np.arange(s, s + len(line) - 1) for s, line in zip(starts, lines)])
+
+        self.add_updater(lambda mob: mob.update_warp())
+        self.update_warp()
+
+    def add_mass(self, source, strength=1.0):
+        """Add a point mass; source is a fixed point or a Mobject to follow"""
+        self.masses.append((source, strength))
+        return self
+
+    def mass_arrays(self):
+        positions = np.array([
+            source.get_center() if isinstance(source, Mobject) else np.asarray(source, float)
+            for source, _ in self.masses
+        ]).reshape(-1, 3)
+        strengths = np.array([strength for _, strength in self.masses], dtype=float)
+        return positions, strengths * self.warp.get_value()
+
+    def warped_vertices(self):
+        positions, strengths = self.mass_arrays()
+        return self.flat_vertices + point_mass_displacement(
+            self.flat_vertices, positions, strengths, self.softening)
+
+    def update_warp(self):
+        """Recompute all vertices and rebuild the Bézier points in one pass"""
+        v = self.warped_vertices()
+        p0 = v[self.segment_start]
+        p1 = v[self.segment_start + 1]
+        # Straight cubic segments: anchors at the ends, handles at thirds
+        bezier = np.stack([p0, (2 * p0 + p1) / 3, (p0 + 2 * p1) / 3, p1], axis=1)
+        self.points = bezier.reshape(-1, 3)
+        return self
+
+    def warp_to(self, value):
+        """Animation that bends the grid toward the given curvature scale"""
+        return self.warp.animate.set_value(value)
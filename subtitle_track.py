@@ -0,0 +1,130 @@
+"""
+Subtitle Track for Relativity Videos
+A subtitle layer that runs alongside a scene's own animations instead of
+blocking them. Cues are scheduled on the scene timeline from narration word
+timings (or spread evenly over the clip when a backend reports none), and a
+single updater shows, fades and swaps them as scene time passes, during
+self.play and self.wait alike. A section lasts as long as its narration,
+not narration plus subtitle time
+
+The track keeps its own clock, advanced by that updater, rather than a
+reference to the scene: Manim copies and hashes mobjects passed to
+self.play, and a scene reference (even inside a closure) would drag the
+whole scene into that work. Times are seconds since the track was first
+added; re-add it straight after self.clear() so its clock keeps running
+
+Usage inside a scene:
+    self.subtitles = SubtitleTrack()
+    self.add_sound(path)
+    self.subtitles.add_clip(words, duration, text)   # cues start now
+    self.add(self.subtitles)
+    self.play(Write(title), run_time=2)              # subtitles keep running
+"""
+
+from bisect import bisect_right
+
+from manim import BLACK, DOWN, NORMAL, WHITE, Rectangle, Text, VGroup
+
+from generate_subtitles import build_timed_cues
+
+
+class SubtitleTrack(VGroup):
+    def __init__(self, font_size=18, font="Arial", max_width=12, fade=0.25, linger=0.4,
+                 **kwargs):
+        """
+        fade: seconds of fade in or out where a cue meets a gap (back-to-back cues just swap)
+        linger: seconds a cue stays up after its last word, unless the next cue starts first
+        """
+        super().__init__(**kwargs)
+        self.time = 0.0   # Scene seconds this track has been on screen
+        self.font_size = font_size
+        self.font = font
+        self.max_width = max_width
+        self.fade = fade
+        self.linger = linger
+        self.cues = []    # (start, end, text) in scene seconds, sorted by start
+        self.starts = []
+        self.ends = []    # Display ends including linger
+        self.fades_in = []
+        self.fades_out = []
+        self.rendered = {}
+        self.current = None
+        self.set_z_index(10)  # Above anything the scene adds later
+        # The dt parameter marks the updater as time-based, so self.wait()
+        # renders every frame instead of freezing a static one
+        self.add_updater(lambda mob, dt: mob.advance(dt))
+
+    def now(self):
+        return self.time
+
+    def advance(self, dt):
+        self.time += dt
+        return self.update_cue()
+
+    def add_clip(self, words, duration, text="", start=None, **cue_options):
+        """
+        Schedule the cues of one narration clip starting at scene time start
+        (default: now). words is [[offset, duration, word], ...] or None.
+        """
+        start = self.now() if start is None else start
+        clip = {"name": "clip", "duration": duration, "text": text, "words": words}
+        self.cues.extend(build_timed_cues([clip], clip_starts={"clip": start}, **cue_options))
+        self.cues.sort()
+        self.starts = [cue_start for cue_start, _, _ in self.cues]
+        next_starts = self.starts[1:] + [float("inf")]
+        self.ends = [min(end + self.linger, next_start)
+                     for (_, end, _), next_start in zip(self.cues, next_starts)]
+        # Back-to-back cues swap directly; only cues next to a gap fade
+        self.fades_out = [end < next_start for end, next_start in zip(self.ends, next_starts)]
+        self.fades_in = [True] + self.fades_out[:-1]
+        self.rendered.clear()
+        self.current = None
+        return self
+
+    def make_cue(self, text):
+        """Styled subtitle: text on a semi-transparent box at the bottom edge"""
+        subtitle = Text(text, font_size=self.font_size, color=WHITE, weight=NORMAL, font=self.font)
+        if subtitle.width > self.max_width - 0.6:
+            subtitle.scale_to_fit_width(self.max_width - 0.6)
+        padding = 0.3
+        bg = Rectangle(
+            width=subtitle.width + padding * 2,
+            height=subtitle.height + padding,
+            fill_color=BLACK,
+            fill_opacity=0.8,
+            stroke_color=WHITE,
+            stroke_width=1,
+            stroke_opacity=0.3
+        )
+        return VGroup(bg, subtitle).to_edge(DOWN, buff=0.8)
+
+    def active_cue(self, t):
+        i = bisect_right(self.starts, t) - 1
+        if i < 0 or t >= self.ends[i]:
+            return None
+        return i
+
+    def update_cue(self):
+        t = self.now()
+        i = self.active_cue(t)
+        if i != self.current:
+            self.remove(*self.submobjects)
+            if i is not None:
+                if i not in self.rendered:
+                    self.rendered[i] = self.make_cue(self.cues[i][2])
+                self.add(self.rendered[i])
+            self.current = i
+        if i is None:
+            return self
+
+        alpha = 1.0
+        if self.fades_in[i]:
+            alpha = min(alpha, (t - self.starts[i]) / self.fade)
+        if self.fades_out[i]:
+            alpha = min(alpha, (self.ends[i] - t) / self.fade)
+        alpha = max(alpha, 0.0)
+        bg, subtitle = self.rendered[i]
+        bg.set_fill(opacity=0.8 * alpha)
+        bg.set_stroke(opacity=0.3 * alpha)
+        subtitle.set_opacity(alpha)
+        return self
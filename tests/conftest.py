@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The project is a flat set of top-level modules run from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,27 @@
+import pytest
+
+from generate_subtitles import build_timed_cues
+
+
+def test_cues_break_at_sentences_and_pauses():
+    words = [[0.0, 0.3, "Time"], [0.3, 0.3, "slows."], [0.6, 0.3, "Space"],
+             [1.5, 0.3, "bends"]]
+    cues = build_timed_cues([{"name": "a", "duration": 2.0, "words": words}])
+    assert [text for _, _, text in cues] == ["Time slows.", "Space", "bends"]
+    assert cues[0][:2] == pytest.approx((0.0, 0.6))
+
+
+def test_cues_break_after_max_words():
+    words = [[i * 0.2, 0.2, f"w{i}"] for i in range(10)]
+    cues = build_timed_cues([{"name": "a", "duration": 2.0, "words": words}], max_words=4)
+    assert [len(text.split()) for _, _, text in cues] == [4, 4, 2]
+
+
+def test_clips_without_timings_are_spread_evenly_and_placed():
+    clips = [{"name": "a", "duration": 2.0, "text": "one two", "words": None},
+             {"name": "b", "duration": 1.0, "text": "three", "words": None}]
+    cues = build_timed_cues(clips, clip_starts={"b": 10.0})
+    assert cues[0][:2] == pytest.approx((0.0, 2.0))
+    assert cues[0][2] == "one two"
+    assert cues[-1][0] == pytest.approx(10.0)
+    assert cues[-1][2] == "three"
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from minkowski_diagram import MinkowskiDiagram  # noqa: E402
+
+
+def test_events_outside_the_box_are_removed_not_hidden():
+    diagram = MinkowskiDiagram(x_range=(-4, 4), ct_range=(0, 4), unit=1.0, show_axes=False)
+    earth_years = [[0.0, t] for t in range(6)]
+    diagram.add_events(earth_years)
+    layer = diagram.event_layers[0][0]
+    assert len(layer.points) == 5  # ct = 5 is above the box
+
+    diagram.velocity.set_value(0.866)
+    diagram.update_boost()
+    x, ct = layer.points[:, 0], layer.points[:, 1]
+    assert 0 < len(layer.points) < 6
+    assert np.all((x >= -4) & (x <= 4) & (ct >= 0) & (ct <= 4))
+    assert len(layer.rgbas) == len(layer.points)
+    np.testing.assert_array_equal(layer.rgbas[:, 3], 1.0)
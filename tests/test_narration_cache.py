@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from narration_cache import NarrationCache, narration_key, normalize_text
+from tts_backends import FakeTTSBackend
+
+
+def fetch(cache, text, output_path=None, voice="en-US-AriaNeural"):
+    return asyncio.run(cache.fetch_with(FakeTTSBackend(), text, output_path, voice))
+
+
+def test_key_ignores_whitespace_but_not_voice_settings():
+    assert normalize_text("  Time\n   dilation ") == "Time dilation"
+    key = narration_key("Time dilation", "aria")
+    assert narration_key("Time   dilation\n", "aria") == key
+    assert narration_key("Time dilation", "guy") != key
+    assert narration_key("Time dilation", "aria", rate="+10%") != key
+    assert narration_key("Time dilation", "aria", engine="fake") != key
+
+
+def test_miss_then_hit(tmp_path):
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    out = tmp_path / "title.wav"
+    path, hit = fetch(cache, "Welcome to relativity", out)
+    assert (path, hit) == (out, False)
+    assert out.exists()
+
+    path, hit = fetch(cache, "Welcome   to relativity", out)
+    assert hit
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_edited_text_is_resynthesized(tmp_path):
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    fetch(cache, "Welcome to relativity")
+    _, hit = fetch(cache, "Welcome to general relativity")
+    assert not hit
+    assert len(cache.index) == 2
+
+
+def test_index_survives_a_new_instance(tmp_path):
+    fetch(NarrationCache(tmp_path / "cache", suffix=".wav"), "Welcome to relativity")
+    _, hit = fetch(NarrationCache(tmp_path / "cache", suffix=".wav"), "Welcome to relativity")
+    assert hit
+
+
+def test_missing_audio_is_a_miss(tmp_path):
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    cached, _ = fetch(cache, "Welcome to relativity")
+    cached.unlink()
+    _, hit = fetch(cache, "Welcome to relativity")
+    assert not hit
+
+
+def test_lru_eviction_keeps_recently_used_clips(tmp_path):
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    first, _ = fetch(cache, "one two three four")
+    clip_bytes = first.stat().st_size
+    cache.max_bytes = int(clip_bytes * 2.5)
+
+    fetch(cache, "five six seven eight")
+    fetch(cache, "one two three four")  # Touch the first clip again
+    fetch(cache, "nine ten eleven twelve")
+
+    assert len(cache.index) == 2
+    assert cache.total_bytes() <= cache.max_bytes
+    assert first.exists()
+    _, hit = fetch(cache, "five six seven eight")
+    assert not hit
+
+
+def test_concurrent_instances_keep_each_others_entries(tmp_path):
+    # Two section workers loaded the index before either stored anything
+    worker_a = NarrationCache(tmp_path / "cache", suffix=".wav")
+    worker_b = NarrationCache(tmp_path / "cache", suffix=".wav")
+    fetch(worker_a, "Clip from worker A")
+    fetch(worker_b, "Clip from worker B")
+
+    merged = NarrationCache(tmp_path / "cache", suffix=".wav")
+    assert len(merged.index) == 2
+    assert not list((tmp_path / "cache").glob("*.tmp"))
+
+
+def test_fetch_timed_returns_word_timings_on_hits(tmp_path):
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    backend = FakeTTSBackend(words_per_second=2.0)
+    _, hit, words = asyncio.run(cache.fetch_timed(backend, "Light is fast", None, "aria"))
+    assert not hit
+    assert [word for _, _, word in words] == ["Light", "is", "fast"]
+    assert words[1][0] == pytest.approx(0.5)
+
+    _, hit, again = asyncio.run(cache.fetch_timed(backend, "Light is fast", None, "aria"))
+    assert hit
+    assert again == words
+
+
+def test_a_hit_is_never_evicted_when_over_the_limit(tmp_path):
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    fetch(cache, "one two three four")
+    fetch(cache, "five six seven eight")
+    cache.max_bytes = 1  # Limit lowered below everything cached
+
+    path, hit = fetch(cache, "one two three four", tmp_path / "out.wav")
+    assert hit
+    assert path.exists()
+    _, hit, words = asyncio.run(cache.fetch_timed(FakeTTSBackend(), "one two three four",
+                                                  None, "en-US-AriaNeural"))
+    assert hit
+    assert [word for _, _, word in words] == ["one", "two", "three", "four"]
@@ -0,0 +1,81 @@
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from narration_mixer import CueRecorder, mix_cues, resampled_path
+
+
+def write_tone(path, seconds, value, rate=24000):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.full(int(seconds * rate), value, dtype="<i2").tobytes())
+    return str(path)
+
+
+def read_samples(path):
+    with wave.open(str(path), "rb") as wav:
+        return wav.getframerate(), np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+
+
+def test_cues_are_placed_and_summed(tmp_path):
+    cues = [
+        {"path": write_tone(tmp_path / "a.wav", 1.0, 1000), "start": 0.0},
+        {"path": write_tone(tmp_path / "b.wav", 1.0, 500), "start": 0.5},
+    ]
+    rate, samples = read_samples(mix_cues(cues, tmp_path / "mix.wav", block_frames=1000))
+    assert rate == 24000
+    assert len(samples) == int(1.5 * rate)
+    assert samples[int(0.25 * rate)] == 1000
+    assert samples[int(0.75 * rate)] == 1500
+    assert samples[int(1.25 * rate)] == 500
+
+
+def test_gain_and_clipping(tmp_path):
+    cues = [
+        {"path": write_tone(tmp_path / "a.wav", 0.1, 20000), "start": 0.0},
+        {"path": write_tone(tmp_path / "b.wav", 0.1, 20000), "start": 0.0},
+        {"path": write_tone(tmp_path / "c.wav", 0.1, 1000), "start": 0.2, "gain": -6.0206},
+    ]
+    rate, samples = read_samples(mix_cues(cues, tmp_path / "mix.wav"))
+    assert samples[int(0.05 * rate)] == 32767
+    assert samples[int(0.25 * rate)] == pytest.approx(500, abs=1)
+
+
+def test_mix_matches_across_block_sizes(tmp_path):
+    cues = [{"path": write_tone(tmp_path / f"{i}.wav", 0.3, 100 * (i + 1)), "start": 0.17 * i}
+            for i in range(4)]
+    _, small = read_samples(mix_cues(cues, tmp_path / "small.wav", block_frames=777))
+    _, large = read_samples(mix_cues(cues, tmp_path / "large.wav", block_frames=1 << 20))
+    np.testing.assert_array_equal(small, large)
+
+
+def test_recorder_records_cues_instead_of_adding_sound(tmp_path):
+    scene = SimpleNamespace(renderer=SimpleNamespace(time=2.0))
+    recorder = CueRecorder(scene, enabled=True, cue_dir=tmp_path)
+    recorder.add_sound("audio/title.wav")
+    assert recorder.cues == [{"path": "audio/title.wav", "start": 2.0, "gain": 0.0}]
+
+
+def test_finish_without_a_movie_only_saves_cues(tmp_path):
+    scene = SimpleNamespace(renderer=SimpleNamespace(time=0.0))
+    recorder = CueRecorder(scene, enabled=True, cue_dir=tmp_path)
+    recorder.add_sound(write_tone(tmp_path / "a.wav", 0.1, 0))
+    assert recorder.finish(None) is None
+    assert recorder.cue_path.exists()
+    assert recorder.output is None
+
+
+def test_resample_cache_follows_the_clip_content(tmp_path):
+    clip = write_tone(tmp_path / "title.wav", 0.1, 1000, rate=22050)
+    before = resampled_path(clip, 24000, tmp_path / "pcm")
+    assert before.parent == tmp_path / "pcm"
+    assert resampled_path(clip, 24000, tmp_path / "pcm") == before
+    assert resampled_path(clip, 48000, tmp_path / "pcm") != before
+
+    write_tone(tmp_path / "title.wav", 0.1, 2000, rate=22050)  # Re-synthesized narration
+    assert resampled_path(clip, 24000, tmp_path / "pcm") != before
+
@@ -0,0 +1,86 @@
+import json
+import wave
+from types import SimpleNamespace
+
+import pytest
+
+from narration_timing import DurationManifest, NarrationTimer, probe_duration
+
+
+def write_wav(path, seconds, rate=8000):
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\0\0" * int(seconds * rate))
+    return path
+
+
+class FakeScene:
+    """Just enough of a Scene for NarrationTimer: a clock and wait()"""
+
+    def __init__(self):
+        self.renderer = SimpleNamespace(time=0.0)
+        self.waits = []
+
+    def wait(self, seconds):
+        self.waits.append(seconds)
+        self.renderer.time += seconds
+
+
+def test_probe_duration_reads_the_wav_header(tmp_path):
+    assert probe_duration(write_wav(tmp_path / "a.wav", 2.5)) == pytest.approx(2.5)
+
+
+def test_manifest_caches_and_merges(tmp_path):
+    a = write_wav(tmp_path / "a.wav", 1.0)
+    b = write_wav(tmp_path / "b.wav", 2.0)
+    manifest_path = tmp_path / "durations.json"
+    first = DurationManifest(manifest_path)
+    second = DurationManifest(manifest_path)  # Another worker, loaded before any save
+    assert first.duration(a) == pytest.approx(1.0)
+    assert second.duration(b) == pytest.approx(2.0)
+
+    with open(manifest_path, encoding="utf-8") as f:
+        assert set(json.load(f)) == {str(a), str(b)}
+
+
+def test_timer_waits_only_for_the_rest_of_the_clip(tmp_path):
+    scene = FakeScene()
+    timer = NarrationTimer(scene, DurationManifest(tmp_path / "durations.json"), tail=0.5)
+    timer.start(write_wav(tmp_path / "a.wav", 4.0))
+    scene.renderer.time += 3.0  # Animations already played
+    assert timer.wait_for_narration() == pytest.approx(1.5)
+    assert timer.remaining() == 0.0
+
+
+def test_extend_never_shortens_a_clip(tmp_path):
+    scene = FakeScene()
+    timer = NarrationTimer(scene, DurationManifest(tmp_path / "durations.json"), tail=0.0)
+    timer.extend(2.0)
+    assert timer.remaining() == pytest.approx(2.0)
+    timer.extend(1.0)
+    assert timer.remaining() == pytest.approx(2.0)
+
+
+def test_rendering_an_unchanged_clip_again_probes_it_once(tmp_path, monkeypatch):
+    import asyncio
+
+    import narration_timing
+    from audio_prep import prepare_audio
+    from narration_cache import NarrationCache
+    from tts_backends import FakeTTSBackend
+
+    probes = []
+    real_probe = narration_timing.probe_duration
+    monkeypatch.setattr(narration_timing, "probe_duration",
+                        lambda path: probes.append(path) or real_probe(path))
+
+    cache = NarrationCache(tmp_path / "cache", suffix=".wav")
+    clip = tmp_path / "title.wav"
+    for _ in range(3):  # Three renders of the same scene
+        source, _ = asyncio.run(cache.fetch_with(FakeTTSBackend(), "Welcome to relativity",
+                                                 None, "aria"))
+        prepare_audio(source, clip)
+        DurationManifest(tmp_path / "durations.json").duration(clip)
+    assert len(probes) == 1
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from relativistic_sky import RelativisticSky, blackbody_rgb
+
+APEX = np.array([7.0, 0.0, 0.0])
+
+
+def sky_stars(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = np.column_stack([rng.uniform(-12, 12, (n, 2)), np.zeros(n)])
+    return positions, np.ones((n, 3)), np.full(n, 0.6)
+
+
+def apparent_rgb(sky, positions, colors, brightness):
+    """What Starfield draws: colour scaled by brightness (alpha never reaches the video)"""
+    moved, tinted, lit = sky(positions, colors, brightness)
+    return moved, tinted * lit[:, None]
+
+
+def test_at_rest_the_sky_is_unchanged():
+    positions, colors, brightness = sky_stars()
+    moved, tinted, lit = RelativisticSky(0.0, APEX)(positions, colors, brightness)
+    np.testing.assert_array_equal(moved, positions)
+    np.testing.assert_array_equal(lit, brightness)
+
+
+def test_stars_crowd_toward_the_apex():
+    positions, colors, brightness = sky_stars()
+    moved, _, _ = RelativisticSky(0.9, APEX)(positions, colors, brightness)
+    before = np.linalg.norm(positions - APEX, axis=1)
+    after = np.linalg.norm(moved - APEX, axis=1)
+    assert np.all(after <= before + 1e-9)
+
+
+def test_forward_stars_are_brighter_in_rgb_than_stars_behind():
+    positions, colors, brightness = sky_stars()
+    moved, rgb = apparent_rgb(RelativisticSky(0.8, APEX), positions, colors, brightness)
+    distance = np.linalg.norm(moved - APEX, axis=1)
+    ahead = rgb[distance < np.percentile(distance, 10)].sum(axis=1).mean()
+    behind = rgb[distance > np.percentile(distance, 90)].sum(axis=1).mean()
+    at_rest = (colors * brightness[:, None]).sum(axis=1).mean()
+    assert ahead > at_rest > behind
+
+
+def test_forward_stars_turn_blue_and_rear_stars_red():
+    positions, colors, brightness = sky_stars()
+    moved, rgb = apparent_rgb(RelativisticSky(0.8, APEX), positions, colors, brightness)
+    distance = np.linalg.norm(moved - APEX, axis=1)
+    ahead, behind = rgb[np.argmin(distance)], rgb[np.argmax(distance)]
+    assert ahead[2] >= ahead[0]
+    assert behind[0] > behind[2]
+
+
+def test_blackbody_colours():
+    np.testing.assert_allclose(blackbody_rgb(6600), [1.0, 1.0, 1.0], atol=0.03)
+    red, blue = blackbody_rgb(2000), blackbody_rgb(20000)
+    assert red[0] > red[2]
+    assert blue[2] > blue[0]
+    assert blackbody_rgb([2000, 20000]).shape == (2, 3)
+
+
+@pytest.mark.parametrize("speed", [0.5, 0.9])
+def test_beamed_brightness_stays_in_range(speed):
+    positions, colors, brightness = sky_stars()
+    _, _, lit = RelativisticSky(speed, APEX)(positions, colors, brightness)
+    assert np.all((lit >= 0) & (lit <= 1))
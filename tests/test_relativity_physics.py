@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from relativity_physics import (
+    C, aberration, beta_from_rapidity, doppler_factor, gamma, gamma_minus_one,
+    inverse_gamma, kinetic_energy, length_contraction, momentum, proper_time,
+    rapidity, rest_energy, time_dilation, total_energy, velocity_addition,
+)
+
+
+def test_gamma_known_values():
+    assert gamma(0.0) == 1.0
+    assert gamma(0.6) == pytest.approx(1.25)
+    assert gamma(0.8) == pytest.approx(5 / 3)
+    assert gamma(-0.8) == pytest.approx(5 / 3)
+
+
+def test_kernels_broadcast_over_arrays():
+    beta = np.array([0.0, 0.6, 0.8])
+    np.testing.assert_allclose(gamma(beta), [1.0, 1.25, 5 / 3])
+    np.testing.assert_allclose(length_contraction(8, beta), [8.0, 6.4, 4.8])
+    np.testing.assert_allclose(time_dilation(1.0, beta), gamma(beta))
+    np.testing.assert_allclose(proper_time(1.0, beta), inverse_gamma(beta))
+
+
+def test_inverse_gamma_keeps_precision_near_c():
+    beta = 1 - 1e-12
+    b = Decimal(beta)  # The float actually stored, exactly
+    exact = float((1 - b * b).sqrt())
+    assert inverse_gamma(beta) == pytest.approx(exact, rel=1e-12)
+    assert np.isfinite(gamma(beta))
+
+
+def test_gamma_minus_one_matches_series_at_walking_pace():
+    beta = 1e-9
+    assert gamma_minus_one(beta) == pytest.approx(beta ** 2 / 2, rel=1e-9)
+
+
+def test_velocity_addition_never_exceeds_c():
+    assert velocity_addition(0.5, 0.5) == pytest.approx(0.8)
+    assert velocity_addition(1.0, 0.9) == pytest.approx(1.0)
+    assert velocity_addition(0.99, 0.99) < 1.0
+
+
+def test_rapidity_is_additive():
+    u, v = 0.3, 0.7
+    assert rapidity(velocity_addition(u, v)) == pytest.approx(rapidity(u) + rapidity(v))
+    assert beta_from_rapidity(rapidity(0.42)) == pytest.approx(0.42)
+
+
+def test_doppler_factor_head_on_and_receding():
+    assert doppler_factor(0.6) == pytest.approx(2.0)
+    assert doppler_factor(0.6, np.pi) == pytest.approx(0.5)
+
+
+def test_aberration_bunches_stars_forward():
+    assert aberration(0.0, 0.5) == pytest.approx(0.5)
+    assert aberration(1.0, 0.5) == pytest.approx(1.0)
+    assert aberration(-1.0, 0.5) == pytest.approx(-1.0)
+
+
+def test_energies():
+    assert rest_energy(1e-3) == pytest.approx(1e-3 * C ** 2)
+    assert rest_energy(1e-3) / 1e12 == pytest.approx(89.875, rel=1e-4)
+    assert total_energy(1.0, 0.6) == pytest.approx(1.25 * C ** 2)
+    assert kinetic_energy(1.0, 0.6) == pytest.approx(0.25 * C ** 2)
+    assert momentum(1.0, 0.6) == pytest.approx(0.75 * C)
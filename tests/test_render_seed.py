@@ -0,0 +1,23 @@
+import numpy as np
+
+from render_seed import DEFAULT_SEED, SEED_ENV_VAR, get_seed, section_rng
+
+
+def test_get_seed_precedence(monkeypatch):
+    monkeypatch.delenv(SEED_ENV_VAR, raising=False)
+    assert get_seed() == DEFAULT_SEED
+    monkeypatch.setenv(SEED_ENV_VAR, "42")
+    assert get_seed() == 42
+    assert get_seed(7) == 7
+
+
+def test_section_rng_is_reproducible_per_section():
+    first = section_rng("opening_sequence", seed=1).uniform(size=5)
+    again = section_rng("opening_sequence", seed=1).uniform(size=5)
+    np.testing.assert_array_equal(first, again)
+
+
+def test_section_rng_differs_between_sections_and_seeds():
+    base = section_rng("opening_sequence", seed=1).uniform(size=5)
+    assert not np.array_equal(base, section_rng("twin_paradox", seed=1).uniform(size=5))
+    assert not np.array_equal(base, section_rng("opening_sequence", seed=2).uniform(size=5))
@@ -0,0 +1,61 @@
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from section_cache import helper_source_hash, project_modules, section_source
+
+
+@pytest.fixture
+def scene_project(tmp_path, monkeypatch):
+    """A scene module importing a helper module, both in a throwaway project dir"""
+    (tmp_path / "stars_helper.py").write_text("def star_count():\n    return 50\n")
+    (tmp_path / "demo_scene.py").write_text(textwrap.dedent("""
+        from stars_helper import star_count
+
+
+        class DemoScene:
+            def opening(self):
+                return self.draw_stars()
+
+            def closing(self):
+                return 0
+
+            def draw_stars(self):
+                return star_count()
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in ("demo_scene", "stars_helper"):
+        sys.modules.pop(name, None)
+
+
+def test_project_modules_finds_imported_helpers(scene_project):
+    scene = importlib.import_module("demo_scene")
+    assert [mod.__name__ for mod in project_modules(scene)] == ["stars_helper"]
+
+
+def test_editing_a_helper_module_changes_the_key(scene_project):
+    scene_class = importlib.import_module("demo_scene").DemoScene
+    before = helper_source_hash(scene_class)
+    (scene_project / "stars_helper.py").write_text("def star_count():\n    return 20000\n")
+    assert helper_source_hash(scene_class) != before
+
+
+def test_section_source_follows_self_calls(scene_project):
+    scene_class = importlib.import_module("demo_scene").DemoScene
+    assert "def draw_stars" in section_source(scene_class, "opening")
+    assert "def draw_stars" not in section_source(scene_class, "closing")
+
+
+def test_section_key_changes_when_a_helper_changes(scene_project):
+    pytest.importorskip("manim")
+    from manim import config
+
+    from section_cache import section_key
+
+    scene_class = importlib.import_module("demo_scene").DemoScene
+    before = section_key(scene_class, scene_class(), "opening", config)
+    (scene_project / "stars_helper.py").write_text("def star_count():\n    return 20000\n")
+    assert section_key(scene_class, scene_class(), "opening", config) != before
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from starfield import Starfield  # noqa: E402
+
+
+def layer_rgbas(stars):
+    """Every star's rgba, in star order"""
+    rgbas = np.zeros((len(stars.brightness), 4))
+    for layer in stars.submobjects:
+        rgbas[layer.star_ids] = layer.rgbas
+    return rgbas
+
+
+def test_brightness_scales_rgb_and_alpha_stays_opaque():
+    stars = Starfield(n_stars=200, rng=np.random.default_rng(0))
+    rgbas = layer_rgbas(stars)
+    np.testing.assert_allclose(rgbas[:, :3], stars.colors * stars.brightness[:, None])
+    np.testing.assert_array_equal(rgbas[:, 3], 1.0)
+
+
+def test_twinkle_dims_the_rgb():
+    stars = Starfield(n_stars=200, rng=np.random.default_rng(0)).start_twinkle(0.5)
+    stars.advance(0.3)
+    rgbas = layer_rgbas(stars)
+    np.testing.assert_allclose(rgbas[:, :3],
+                               stars.colors * stars.current_brightness()[:, None])
+    shown = rgbas[:, :3].max(axis=1)
+    assert np.all(shown <= stars.brightness + 1e-12)
+    assert np.any(shown < stars.brightness - 0.05)
+
+
+def test_relativistic_sky_beaming_reaches_the_rgb():
+    from relativistic_sky import RelativisticSky
+
+    apex = np.array([7.0, 0.0, 0.0])
+    stars = Starfield(n_stars=400, x_range=(-12, 12), y_range=(-12, 12),
+                      rng=np.random.default_rng(0))
+    stars.set_transform(RelativisticSky(0.8, apex))
+    rgbas = layer_rgbas(stars)
+    distance = np.linalg.norm(stars.base_positions - apex, axis=1)
+    ahead = rgbas[distance < np.percentile(distance, 10), :3].sum(axis=1).mean()
+    behind = rgbas[distance > np.percentile(distance, 90), :3].sum(axis=1).mean()
+    assert ahead > behind
+    np.testing.assert_array_equal(rgbas[:, 3], 1.0)
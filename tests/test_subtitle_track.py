@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from subtitle_track import SubtitleTrack  # noqa: E402
+
+WORDS = [[0.0, 0.4, "Time"], [0.4, 0.4, "slows."], [2.0, 0.4, "Space"], [2.4, 0.4, "bends."]]
+
+
+def shown_text(track):
+    return None if track.current is None else track.cues[track.current][2]
+
+
+def test_cues_follow_the_tracks_own_clock():
+    track = SubtitleTrack(fade=0.2, linger=0.3)
+    track.add_clip(WORDS, 3.0)
+    track.update(0.1)
+    assert shown_text(track) == "Time slows."
+    track.update(1.0)  # 1.1 s: after the first cue's linger
+    assert shown_text(track) is None
+    track.update(1.0)  # 2.1 s
+    assert shown_text(track) == "Space bends."
+    assert track.now() == pytest.approx(2.1)
+
+
+def test_clips_added_later_start_at_the_current_time():
+    track = SubtitleTrack()
+    track.update(5.0)
+    track.add_clip(WORDS, 3.0)
+    assert track.starts[0] == pytest.approx(5.0)
+
+
+def test_the_track_holds_no_scene():
+    track = SubtitleTrack()
+    assert not any(hasattr(value, "renderer") for value in vars(track).values())
@@ -0,0 +1,33 @@
+import asyncio
+import wave
+
+import pytest
+
+from tts_backends import FakeTTSBackend, parse_percent
+
+
+def test_parse_percent():
+    assert parse_percent("+10%") == pytest.approx(0.10)
+    assert parse_percent("-25%") == pytest.approx(-0.25)
+    assert parse_percent("") == 0.0
+
+
+def test_fake_duration_is_proportional_to_words_and_rate():
+    backend = FakeTTSBackend(words_per_second=2.0)
+    assert backend.duration_for("one two three four") == pytest.approx(2.0)
+    assert backend.duration_for("one two three four", rate="+100%") == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("rate", ["-100%", "-150%"])
+def test_fake_duration_stays_positive_at_extreme_rates(rate):
+    backend = FakeTTSBackend(words_per_second=2.0)
+    assert backend.duration_for("one two", rate=rate) == pytest.approx(10.0)
+
+
+def test_fake_synthesize_writes_matching_wav(tmp_path):
+    backend = FakeTTSBackend(words_per_second=2.0, sample_rate=8000, tone_hz=440)
+    path = tmp_path / "clip.wav"
+    words = asyncio.run(backend.synthesize("one two three", path, "any"))
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getnframes() / wav.getframerate() == pytest.approx(1.5)
+    assert [round(offset, 3) for offset, _, _ in words] == [0.0, 0.5, 1.0]
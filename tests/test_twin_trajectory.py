@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from relativity_physics import inverse_gamma
+from twin_trajectory import TwinTrip, cumulative_trapezoid
+
+
+def test_cumulative_trapezoid_integrates_linear_function_exactly():
+    x = np.linspace(0, 2, 5)
+    np.testing.assert_allclose(cumulative_trapezoid(x, x), x ** 2 / 2)
+
+
+def test_constant_velocity_matches_time_dilation():
+    trip = TwinTrip([(0.0, 0.6), (5.0, 0.6)])
+    assert trip.earth_age() == pytest.approx(5.0)
+    assert trip.traveller_age() == pytest.approx(5.0 * inverse_gamma(0.6))
+    assert trip.position_at(5.0) == pytest.approx(3.0)
+
+
+def test_round_trip_ages():
+    trip = TwinTrip.round_trip(speed=0.866, distance=3.0, accel_time=0.4)
+    assert trip.earth_age() == pytest.approx(2 * 3.0 / 0.866 + 2 * 0.4)
+    assert trip.earth_age() == pytest.approx(7.73, abs=0.01)
+    assert trip.traveller_age() == pytest.approx(4.43, abs=0.01)
+    assert trip.age_gap() == pytest.approx(trip.earth_age() - trip.traveller_age())
+
+
+def test_round_trip_reaches_the_star_and_comes_home():
+    trip = TwinTrip.round_trip(speed=0.8, distance=4.0, accel_time=0.5)
+    assert trip.x.max() == pytest.approx(4.0, abs=1e-3)
+    assert trip.turnaround_time() == pytest.approx(trip.duration / 2, abs=1e-2)
+    assert trip.position_at(trip.duration) == pytest.approx(0.0, abs=1e-6)
+    assert trip.velocity_at(trip.duration) == 0.0
+
+
+def test_lookups_clamp_to_the_trip():
+    trip = TwinTrip.round_trip()
+    assert trip.proper_time_at(-1.0) == 0.0
+    assert trip.proper_time_at(trip.duration + 1.0) == trip.traveller_age()
+
+
+def test_age_ticks_follow_the_worldline():
+    trip = TwinTrip.round_trip()
+    ticks = trip.age_ticks(1.0)
+    assert len(ticks) == int(trip.traveller_age()) + 1
+    assert trip.worldline().shape == (len(trip.t), 2)
+    np.testing.assert_allclose(ticks[0], [0.0, 0.0])
+
+
+def test_rejects_faster_than_light_and_impossible_trips():
+    with pytest.raises(ValueError):
+        TwinTrip([(0.0, 0.5), (1.0, 1.0)])
+    with pytest.raises(ValueError):
+        TwinTrip.round_trip(speed=0.9, distance=0.1, accel_time=1.0)
@@ -0,0 +1,139 @@
+"""
+Text-to-Speech Backends for Relativity Videos
+One interface over edge-tts (online), pyttsx3 (offline) and a deterministic
+fake, so narration pipelines can be built on air-gapped render boxes
+
+Pick a backend with the RELATIVITY_TTS_BACKEND environment variable:
+    edge     Microsoft Edge neural voices (default, needs internet)
+    pyttsx3  Local system voices (SAPI5 / NSSpeechSynthesizer / eSpeak)
+    fake     Silent or tone WAV with text-proportional length (no TTS at all)
+"""
+
+import asyncio
+import os
+import threading
+import wave
+
+import numpy as np
+
+BACKEND_ENV_VAR = "RELATIVITY_TTS_BACKEND"
+
+
+def parse_percent(value):
+    """Turn an edge-tts style "+10%" / "-25%" string into 0.10 / -0.25"""
+    return float(str(value).strip().rstrip("%") or 0) / 100
+
+
+class EdgeTTSBackend:
+    """Microsoft Edge neural voices via edge-tts (writes MP3)"""
+    name = "edge-tts"
+    suffix = ".mp3"
+
+    async def synthesize(self, text, path, voice, rate="+0%", volume="+0%"):
+        """Stream the MP3 to path and return its WordBoundary timings"""
+        import edge_tts
+
+        try:
+            communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume,
+                                               boundary="WordBoundary")
+        except TypeError:
+            # edge-tts < 7 has no boundary option and always sends word events
+            communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume)
+
+        words = []
+        with open(path, "wb") as f:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    f.write(chunk["data"])
+                elif chunk["type"] == "WordBoundary":
+                    # Offsets arrive in 100-nanosecond ticks
+                    words.append([chunk["offset"] / 1e7, chunk["duration"] / 1e7, chunk["text"]])
+        return words
+
+
+class Pyttsx3Backend:
+    """Offline system voices via pyttsx3 (writes WAV)"""
+    name = "pyttsx3"
+    suffix = ".wav"
+    base_rate = 180  # words per minute at "+0%"
+
+    # pyttsx3 drivers are not thread-safe, so clips are spoken one at a time
+    _lock = threading.Lock()
+
+    def _save(self, text, path, voice, rate, volume):
+        import pyttsx3
+
+        with self._lock:
+            engine = pyttsx3.init()
+            # Edge voice names won't exist locally; use a match if there is one
+            for installed in engine.getProperty("voices"):
+                if voice and voice.lower() in f"{installed.id} {installed.name}".lower():
+                    engine.setProperty("voice", installed.id)
+                    break
+            engine.setProperty("rate", int(self.base_rate * max(1 + parse_percent(rate), 0.1)))
+            engine.setProperty("volume", min(max(1 + parse_percent(volume), 0.0), 1.0))
+            engine.save_to_file(text, str(path))
+            engine.runAndWait()
+            engine.stop()
+
+    async def synthesize(self, text, path, voice, rate="+0%", volume="+0%"):
+        """Write a WAV to path; system voices report no word timings"""
+        await asyncio.to_thread(self._save, text, path, voice, rate, volume)
+        return None
+
+
+class FakeTTSBackend:
+    """Deterministic stand-in that writes silence or a tone (writes WAV)"""
+    name = "fake"
+    suffix = ".wav"
+
+    def __init__(self, words_per_second=2.5, sample_rate=22050, tone_hz=None):
+        self.words_per_second = words_per_second
+        self.sample_rate = sample_rate
+        self.tone_hz = tone_hz  # None = silence
+
+    def duration_for(self, text, rate="+0%"):
+        """Seconds of audio for text; same text and rate always match"""
+        words = max(len(text.split()), 1)
+        speed = max(1 + parse_percent(rate), 0.1)  # "-100%" would mean never finishing
+        return words / (self.words_per_second * speed)
+
+    def _save(self, text, path, rate, volume):
+        n_samples = int(round(self.duration_for(text, rate) * self.sample_rate))
+        if self.tone_hz:
+            t = np.arange(n_samples) / self.sample_rate
+            amplitude = 0.2 * min(max(1 + parse_percent(volume), 0.0), 2.0)
+            samples = (amplitude * 32767 * np.sin(2 * np.pi * self.tone_hz * t)).astype("<i2")
+        else:
+            samples = np.zeros(n_samples, dtype="<i2")
+
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(samples.tobytes())
+
+    async def synthesize(self, text, path, voice, rate="+0%", volume="+0%"):
+        """Write a WAV to path and return evenly spaced word timings"""
+        self._save(text, path, rate, volume)
+        words = text.split()
+        step = self.duration_for(text, rate) / max(len(words), 1)
+        return [[i * step, step, word] for i, word in enumerate(words)]
+
+
+BACKENDS = {
+    "edge": EdgeTTSBackend,
+    "edge-tts": EdgeTTSBackend,
+    "pyttsx3": Pyttsx3Backend,
+    "offline": Pyttsx3Backend,
+    "fake": FakeTTSBackend,
+}
+
+
+def get_backend(name=None):
+    """Return a backend instance by name, or from RELATIVITY_TTS_BACKEND"""
+    name = (name or os.environ.get(BACKEND_ENV_VAR) or "edge").lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend '{name}'. "
+                         f"Choose one of: {', '.join(sorted(BACKENDS))}")
+    return BACKENDS[name]()
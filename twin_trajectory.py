@@ -0,0 +1,103 @@
+"""
+Twin Paradox Trajectories for Relativity Videos
+Integrates the travelling twin's proper time for any piecewise-linear
+velocity profile (coasting legs plus acceleration phases), vectorized over
+a dense grid of Earth-frame time samples. Positions, ages, clock angles and
+worldline points are computed once; animations only look values up
+
+Units: years and light-years, so c = 1 and velocities are fractions of c.
+
+Usage:
+    trip = TwinTrip.round_trip(speed=0.9, distance=3.0, accel_time=0.4)
+    trip.duration, trip.traveller_age()     # Earth years vs ship years
+    trip.proper_time_at(t)                  # drive a RelativisticClock
+    trip.worldline()                        # (N, 2) [x, ct] for MinkowskiDiagram
+"""
+
+import numpy as np
+
+from relativity_physics import inverse_gamma
+
+
+def cumulative_trapezoid(y, x):
+    """Running integral of y(x) starting at 0"""
+    out = np.zeros_like(y)
+    out[1:] = np.cumsum((y[1:] + y[:-1]) * np.diff(x) / 2)
+    return out
+
+
+class TwinTrip:
+    def __init__(self, breakpoints, samples=4001):
+        """
+        breakpoints: [(t, v), ...] Earth-frame times (years) and velocities
+        (fraction of c); velocity is linear between them, so a change of
+        velocity is an acceleration phase and a repeated velocity is a coast
+        """
+        breakpoints = np.asarray(breakpoints, dtype=float)
+        self.breakpoints = breakpoints
+        self.t = np.linspace(breakpoints[0, 0], breakpoints[-1, 0], samples)
+        self.v = np.interp(self.t, breakpoints[:, 0], breakpoints[:, 1])
+        if np.any(np.abs(self.v) >= 1):
+            raise ValueError("Velocities must stay below the speed of light")
+        self.x = cumulative_trapezoid(self.v, self.t)
+        self.tau = cumulative_trapezoid(inverse_gamma(self.v), self.t)  # dtau = dt / gamma
+        self.duration = self.t[-1] - self.t[0]
+
+    @classmethod
+    def round_trip(cls, speed=0.866, distance=3.0, accel_time=0.4, samples=4001):
+        """
+        Accelerate to speed, coast to a star `distance` light-years away, turn
+        around (passing through rest at the star), coast home and stop.
+        Each acceleration phase lasts accel_time Earth years.
+        """
+        coast = distance / speed - accel_time
+        if coast < 0:
+            raise ValueError("accel_time is too long to reach the star at this speed")
+        t = np.cumsum([0, accel_time, coast, accel_time, accel_time, coast, accel_time])
+        v = [0, speed, speed, 0, -speed, -speed, 0]
+        return cls(np.column_stack([t, v]), samples)
+
+    # Lookups for animations
+
+    def _index(self, t):
+        """Nearest precomputed sample for Earth time t"""
+        f = (np.clip(t, self.t[0], self.t[-1]) - self.t[0]) / self.duration
+        return np.rint(f * (len(self.t) - 1)).astype(int)
+
+    def position_at(self, t):
+        return self.x[self._index(t)]
+
+    def velocity_at(self, t):
+        return self.v[self._index(t)]
+
+    def proper_time_at(self, t):
+        return self.tau[self._index(t)]
+
+    def turnaround_time(self):
+        """Earth time when the ship is farthest from Earth"""
+        return self.t[np.argmax(self.x)]
+
+    def clock_angles(self, period=1.0):
+        """Clockwise hand angles for every sample: (earth, traveller)"""
+        return -2 * np.pi * self.t / period, -2 * np.pi * self.tau / period
+
+    # Whole-trip results
+
+    def earth_age(self):
+        return self.duration
+
+    def traveller_age(self):
+        return self.tau[-1]
+
+    def age_gap(self):
+        return self.earth_age() - self.traveller_age()
+
+    def worldline(self):
+        """Traveller's worldline as (N, 2) [x, ct] points"""
+        return np.column_stack([self.x, self.t])
+
+    def age_ticks(self, step=1.0):
+        """[x, ct] events where the traveller completes each `step` years of age"""
+        ages = np.arange(0, self.tau[-1] + 1e-9, step)
+        t = np.interp(ages, self.tau, self.t)
+        return np.column_stack([np.interp(t, self.t, self.x), t])